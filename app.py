@@ -8,9 +8,10 @@ the SPAR encounter complications engine.
 
 import streamlit as st
 from pathlib import Path
+from typing import Any, Dict
 
-from spar_engine.content import load_pack
-from spar_engine.engine import generate_event
+from spar_engine.content import load_pack_cached
+from spar_engine.engine import generate_event, prepare_selection
 from spar_engine.models import Constraints, EngineState, SceneContext, SelectionContext
 from spar_engine.rng import TraceRNG
 
@@ -18,7 +19,119 @@ from spar_engine.rng import TraceRNG
 # Load content once and cache it
 @st.cache_resource
 def load_content():
-    return load_pack("data/core_complications.json")
+    return load_pack_cached("data/core_complications.json")
+
+
+# st.fragment is stable from Streamlit 1.37; older releases ship it as experimental.
+_fragment = getattr(st, "fragment", None) or st.experimental_fragment
+
+
+def event_view(event) -> Dict[str, Any]:
+    """Precompute the display strings for one event.
+
+    Built once when the event is generated and kept in session state, so
+    reruns re-render events without re-joining tags or re-formatting captions.
+    """
+    ev = event.effect_vector
+    effects = [
+        ("Threat", ev.threat),
+        ("Cost", ev.cost),
+        ("Heat", ev.heat),
+        ("Time Pressure", ev.time_pressure),
+    ]
+    return {
+        "label": f"**{event.title}** (Severity: {event.severity})",
+        "severity": event.severity,
+        "cutoff": "Yes" if event.cutoff_applied else "No",
+        "resolution": f"Resolution: {event.cutoff_resolution}" if event.cutoff_applied else "",
+        "tags": ", ".join(event.tags),
+        "effects": [f"{name}: +{v}" for name, v in effects if v > 0],
+        "prompt": event.fiction.prompt,
+        "choices": [f"• {choice}" for choice in event.fiction.immediate_choice],
+        "followups": [f.get("tag", "") + ": " + f.get("in", "") for f in event.followups],
+    }
+
+
+def render_event(view: Dict[str, Any]) -> None:
+    with st.expander(view["label"], expanded=True):
+        col_a, col_b = st.columns([1, 2])
+
+        with col_a:
+            st.metric("Severity", view["severity"])
+            st.metric("Cutoff Applied", view["cutoff"])
+            if view["resolution"]:
+                st.caption(view["resolution"])
+
+        with col_b:
+            if view["tags"]:
+                st.write("**Tags:**", view["tags"])
+            for line in view["effects"]:
+                st.caption(line)
+
+        if view["prompt"]:
+            st.markdown("**Fiction:**")
+            st.write(view["prompt"])
+
+        if view["choices"]:
+            st.markdown("**Immediate Choices:**")
+            for line in view["choices"]:
+                st.write(line)
+
+        if view["followups"]:
+            st.markdown("**Follow-ups:**")
+            for line in view["followups"]:
+                st.caption(line)
+
+
+@_fragment
+def generation_panel(entries, scene: SceneContext, selection: SelectionContext) -> None:
+    """Generation controls and results.
+
+    Runs as a fragment: pressing Generate reruns only this block, and each
+    event is rendered as soon as it is generated.
+    """
+    st.header("🎪 Generate Complications")
+
+    # Generation controls
+    col_gen1, col_gen2, col_gen3 = st.columns(3)
+
+    with col_gen1:
+        seed = st.number_input("RNG Seed", value=42, min_value=0,
+                             help="For reproducible results")
+
+    with col_gen2:
+        count = st.number_input("Event Count", value=1, min_value=1, max_value=10,
+                              help="How many complications to generate")
+
+    with col_gen3:
+        generate = st.button("🎲 Generate", type="primary", use_container_width=True)
+
+    # Store display views for generated events
+    if 'events' not in st.session_state:
+        st.session_state.events = []
+
+    if generate:
+        st.header("📋 Generated Complications")
+
+        rng = TraceRNG(seed=seed)
+        state = EngineState.default()
+        prepared = prepare_selection(scene, selection, entries)
+
+        views = []
+        for i in range(count):
+            rng.reset_trace()
+            event = generate_event(scene, state, selection, entries, rng, prepared=prepared)
+            view = event_view(event)
+            views.append(view)
+            render_event(view)
+
+        st.session_state.events = views
+
+    # Display previously generated events
+    elif st.session_state.events:
+        st.header("📋 Generated Complications")
+        for view in st.session_state.events:
+            render_event(view)
 
 
 def main():
@@ -111,103 +224,29 @@ def main():
         help="Exclude entries with these tags"
     )
 
+    # Contexts are cheap to build; the fragment below only uses them on Generate.
+    scene = SceneContext(
+        scene_id="streamlit-demo",
+        scene_phase=scene_phase,
+        environment=environment,
+        tone=tone,
+        constraints=Constraints(confinement, connectivity, visibility),
+        party_band=party_band,
+        spotlight=spotlight,
+    )
+    selection = SelectionContext(
+        enabled_packs=["core_complications_v0_1"],
+        include_tags=include_tags,
+        exclude_tags=exclude_tags,
+        factions_present=[],
+        rarity_mode=rarity_mode,
+    )
+
     # Main content area
     col1, col2 = st.columns([2, 1])
 
     with col1:
-        st.header("🎪 Generate Complications")
-
-        # Generation controls
-        col_gen1, col_gen2, col_gen3 = st.columns(3)
-
-        with col_gen1:
-            seed = st.number_input("RNG Seed", value=42, min_value=0,
-                                 help="For reproducible results")
-
-        with col_gen2:
-            count = st.number_input("Event Count", value=1, min_value=1, max_value=10,
-                                  help="How many complications to generate")
-
-        with col_gen3:
-            generate = st.button("🎲 Generate", type="primary", use_container_width=True)
-
-    # Store state for generated events
-    if 'events' not in st.session_state:
-        st.session_state.events = []
-
-    if generate:
-        # Create scene context
-        scene = SceneContext(
-            scene_id="streamlit-demo",
-            scene_phase=scene_phase,
-            environment=environment,
-            tone=tone,
-            constraints=Constraints(confinement, connectivity, visibility),
-            party_band=party_band,
-            spotlight=spotlight,
-        )
-
-        # Create selection context
-        selection = SelectionContext(
-            enabled_packs=["core_complications_v0_1"],
-            include_tags=include_tags,
-            exclude_tags=exclude_tags,
-            factions_present=[],
-            rarity_mode=rarity_mode,
-        )
-
-        # Generate events
-        rng = TraceRNG(seed=seed)
-        state = EngineState.default()
-
-        events = []
-        for i in range(count):
-            rng.trace.clear()
-            event = generate_event(scene, state, selection, entries, rng)
-            events.append(event)
-
-        st.session_state.events = events
-
-    # Display generated events
-    if st.session_state.events:
-        st.header("📋 Generated Complications")
-
-        for i, event in enumerate(st.session_state.events):
-            with st.expander(f"**{event.title}** (Severity: {event.severity})", expanded=True):
-                col_a, col_b = st.columns([1, 2])
-
-                with col_a:
-                    st.metric("Severity", event.severity)
-                    st.metric("Cutoff Applied", "Yes" if event.cutoff_applied else "No")
-                    if event.cutoff_applied:
-                        st.caption(f"Resolution: {event.cutoff_resolution}")
-
-                with col_b:
-                    if event.tags:
-                        st.write("**Tags:**", ", ".join(event.tags))
-
-                    if event.effect_vector.threat > 0:
-                        st.caption(f"Threat: +{event.effect_vector.threat}")
-                    if event.effect_vector.cost > 0:
-                        st.caption(f"Cost: +{event.effect_vector.cost}")
-                    if event.effect_vector.heat > 0:
-                        st.caption(f"Heat: +{event.effect_vector.heat}")
-                    if event.effect_vector.time_pressure > 0:
-                        st.caption(f"Time Pressure: +{event.effect_vector.time_pressure}")
-
-                if event.fiction.prompt:
-                    st.markdown("**Fiction:**")
-                    st.write(event.fiction.prompt)
-
-                if event.fiction.immediate_choice:
-                    st.markdown("**Immediate Choices:**")
-                    for choice in event.fiction.immediate_choice:
-                        st.write(f"• {choice}")
-
-                if event.followups:
-                    st.markdown("**Follow-ups:**")
-                    for followup in event.followups:
-                        st.caption(followup.get("tag", "") + ": " + followup.get("in", ""))
+        generation_panel(entries, scene, selection)
 
     with col2:
         st.header("📊 Current Scene")
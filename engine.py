@@ -16,16 +16,29 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from dataclasses import asdict
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-from spar_engine.content import load_pack
-from spar_engine.engine import generate_event
-from spar_engine.models import Constraints, EngineState, SceneContext, SelectionContext
+from spar_engine.content import load_pack_cached
+from spar_engine.engine import generate_event, prepare_selection
+from spar_engine.models import Constraints, EngineEvent, EngineState, SceneContext, SelectionContext
 from spar_engine.rng import TraceRNG
 from spar_engine.state import apply_state_delta, tick_state
 
+try:  # Optional speedup: orjson is a C JSON codec; stdlib json is the fallback.
+    import orjson
+except ImportError:  # pragma: no cover - exercised only when orjson is absent
+    orjson = None
+
+
+_DEFAULT_INCLUDE_TAGS = (
+    "hazard", "reinforcements", "time_pressure", "social_friction", "visibility",
+    "mystic", "attrition", "terrain", "positioning",
+)
+_DEFAULT_INCLUDE_TAGS_CSV = ",".join(_DEFAULT_INCLUDE_TAGS)
+
 
 def _split_csv(v: str) -> List[str]:
     if not v:
@@ -72,7 +85,7 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--rarity-mode", choices=["calm", "normal", "spiky"], default="normal")
     p.add_argument(
         "--include-tags",
-        default="hazard,reinforcements,time_pressure,social_friction,visibility,mystic,attrition,terrain,positioning",
+        default=_DEFAULT_INCLUDE_TAGS_CSV,
         help="Comma-separated tags; entry must match at least one.",
     )
     p.add_argument("--exclude-tags", default="", help="Comma-separated tags to exclude.")
@@ -97,10 +110,10 @@ def build_parser() -> argparse.ArgumentParser:
 
 def _load_state(path: str) -> EngineState:
     p = Path(path)
-    raw = json.loads(p.read_text())
+    raw = orjson.loads(p.read_bytes()) if orjson is not None else json.loads(p.read_text())
     return EngineState(
         clocks=dict(raw.get("clocks", {})),
-        recent_event_ids=list(raw.get("recent_event_ids", [])),
+        recent_event_ids=list(map(sys.intern, raw.get("recent_event_ids", []))),
         tag_cooldowns=dict(raw.get("tag_cooldowns", {})),
         flags=dict(raw.get("flags", {})),
     )
@@ -109,13 +122,92 @@ def _load_state(path: str) -> EngineState:
 def _save_state(path: str, state: EngineState) -> None:
     p = Path(path)
     payload = asdict(state)
-    p.write_text(json.dumps(payload, indent=2))
+    if orjson is not None:
+        p.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        p.write_text(json.dumps(payload, indent=2))
+
+
+def _event_to_dict(event: EngineEvent, include_trace: bool) -> dict:
+    """Plain-dict form of an EngineEvent, equivalent to `asdict` but without
+    its recursive reflection/deep-copy; rng_trace is included only on request."""
+    ev = event.effect_vector
+    fic = event.fiction
+    delta = event.state_delta
+    payload = {
+        "event_id": event.event_id,
+        "title": event.title,
+        "tags": event.tags,
+        "severity": event.severity,
+        "cutoff_applied": event.cutoff_applied,
+        "cutoff_resolution": event.cutoff_resolution,
+        "original_severity": event.original_severity,
+        "effect_vector": {
+            "threat": ev.threat,
+            "cost": ev.cost,
+            "heat": ev.heat,
+            "time_pressure": ev.time_pressure,
+            "position_shift": ev.position_shift,
+            "information": ev.information,
+            "opportunity": ev.opportunity,
+        },
+        "fiction": {
+            "prompt": fic.prompt,
+            "sensory": fic.sensory,
+            "immediate_choice": fic.immediate_choice,
+        },
+        "state_delta": {
+            "clocks": delta.clocks,
+            "recent_event_ids_add": delta.recent_event_ids_add,
+            "tag_cooldowns_set": delta.tag_cooldowns_set,
+            "flags_set": delta.flags_set,
+        },
+        "followups": event.followups,
+    }
+    if include_trace:
+        payload["rng_trace"] = event.rng_trace
+    return payload
+
+
+def _format_pretty(event: EngineEvent, n: int, count: int) -> str:
+    """Render one event for --format pretty as a single string (one write per event)."""
+    parts = [
+        f"== Event {n}/{count} ==\n"
+        f"{event.title}  (id={event.event_id})\n"
+        f"Severity: {event.severity}   Cutoff: {event.cutoff_applied} ({event.cutoff_resolution})\n"
+        f"Tags: {', '.join(event.tags)}\n"
+        f"Effects: {event.effect_vector}\n"
+    ]
+    if event.fiction.prompt:
+        parts.append(f"\n{event.fiction.prompt}\n")
+    if event.fiction.immediate_choice:
+        parts.append("Choices:\n")
+        parts.extend(f" - {c}\n" for c in event.fiction.immediate_choice)
+    parts.append("\n")
+    return "".join(parts)
+
+
+def _write_jsonl(payload: dict) -> None:
+    if orjson is not None:
+        out = sys.stdout.buffer
+        out.write(orjson.dumps(payload))
+        out.write(b"\n")
+    else:
+        print(json.dumps(payload, ensure_ascii=False))
 
 
 def main() -> int:
     args = build_parser().parse_args()
 
-    entries = load_pack(Path(args.pack))
+    entries = load_pack_cached(Path(args.pack))
+
+    forced_id = (args.event_id or args.event or "").strip()
+    if forced_id:
+        # One early-exit scan instead of an any() check plus a filtered rebuild
+        matched = next((e for e in entries if e.event_id == forced_id), None)
+        if matched is None:
+            raise SystemExit(f"--event-id/--event {forced_id!r} not found in pack {args.pack!r}")
+        entries = [matched]
 
     preset_constraints, preset_env = _scene_preset(args.scene_preset) if args.scene_preset else (_scene_preset("")[0], "")
     env = _split_csv(args.env) if args.env else ([preset_env] if preset_env else ["dungeon"])
@@ -150,41 +242,22 @@ def main() -> int:
     if args.tick_mode != "none" and args.ticks > 0:
         state = tick_state(state, ticks=args.ticks)
 
-    forced_id = (args.event_id or args.event or "").strip()
-    if forced_id:
-        if not any(e.event_id == forced_id for e in entries):
-            raise SystemExit(f"--event-id/--event {forced_id!r} not found in pack {args.pack!r}")
-        entries = [e for e in entries if e.event_id == forced_id]
-
-    rng = TraceRNG(seed=args.seed)
+    rng = TraceRNG(seed=args.seed, trace_enabled=args.show_trace)
+    # Selection setup once; events are still generated and written one at a
+    # time so output streams and survives a mid-run failure.
+    prepared = prepare_selection(scene, selection, entries)
 
     for i in range(args.count):
-        rng.trace.clear()
-        event = generate_event(scene, state, selection, entries, rng)
+        rng.reset_trace()
+        event = generate_event(scene, state, selection, entries, rng, prepared=prepared)
 
         # Apply delta for subsequent events in this same invocation (and for state-out)
         state = apply_state_delta(state, event.state_delta)
 
-        payload = asdict(event)
-        if not args.show_trace:
-            payload.pop("rng_trace", None)
-
         if args.format == "jsonl":
-            print(json.dumps(payload, ensure_ascii=False))
+            _write_jsonl(_event_to_dict(event, include_trace=args.show_trace))
         else:
-            print(f"== Event {i+1}/{args.count} ==")
-            print(f"{event.title}  (id={event.event_id})")
-            print(f"Severity: {event.severity}   Cutoff: {event.cutoff_applied} ({event.cutoff_resolution})")
-            print(f"Tags: {', '.join(event.tags)}")
-            print(f"Effects: {event.effect_vector}")
-            if event.fiction.prompt:
-                print()
-                print(event.fiction.prompt)
-            if event.fiction.immediate_choice:
-                print("Choices:")
-                for c in event.fiction.immediate_choice:
-                    print(f" - {c}")
-            print()
+            sys.stdout.write(_format_pretty(event, i + 1, args.count))
 
     if args.state_out:
         _save_state(args.state_out, state)
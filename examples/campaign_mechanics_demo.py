@@ -29,6 +29,10 @@ from spar_campaign import (
 )
 
 
+# Effect channels reported per scene, in display order
+_EFFECT_COLS = ("threat", "cost", "heat", "time_pressure", "information", "opportunity")
+
+
 def run_campaign_demo():
     """Run a 6-scene campaign demonstrating long-term pressure tracking."""
     
@@ -40,7 +44,7 @@ def run_campaign_demo():
     # Initialize states
     campaign_state = CampaignState.default()
     engine_state = EngineState.default()
-    rng = TraceRNG(seed=42)
+    rng = TraceRNG(seed=42, trace_enabled=False)
     
     # Load content pack
     entries = load_pack("data/core_complications.json")
@@ -142,15 +146,8 @@ def run_campaign_demo():
             print(f"  Cutoff: {event.cutoff_resolution} (original: {event.original_severity})")
         print(f"  Tags: {event.tags}")
         print(f"  Effect Vector:")
-        ev_dict = {
-            "threat": event.effect_vector.threat,
-            "cost": event.effect_vector.cost,
-            "heat": event.effect_vector.heat,
-            "time_pressure": event.effect_vector.time_pressure,
-            "information": event.effect_vector.information,
-            "opportunity": event.effect_vector.opportunity,
-        }
-        for k, v in ev_dict.items():
+        for k in _EFFECT_COLS:
+            v = getattr(event.effect_vector, k)
             if v > 0:
                 print(f"    {k}: {v}")
         
@@ -166,7 +163,7 @@ def run_campaign_demo():
             severity=event.severity,
             cutoff_applied=event.cutoff_applied,
             tags=event.tags,
-            effect_vector_dict=ev_dict,
+            effect_vector_dict=event.effect_vector,
         )
         
         # Apply campaign delta
@@ -38,27 +38,35 @@ from spar_campaign import (
 def run_v02_demo():
     """Run 8-scene campaign demonstrating v0.2 features."""
     
-    print("=" * 80)
-    print("SPAR Campaign Mechanics v0.2 - Demonstration")
-    print("Structured Scars • Faction Tracking • Long-Arc Bands")
-    print("=" * 80)
-    print()
+    # Output is collected per scene and written in one call
+    lines: List[str] = []
+    emit = lines.append
+    
+    def flush() -> None:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+    
+    emit("=" * 80)
+    emit("SPAR Campaign Mechanics v0.2 - Demonstration")
+    emit("Structured Scars • Faction Tracking • Long-Arc Bands")
+    emit("=" * 80)
+    emit("")
     
     # Initialize states
     campaign_state = CampaignState.default()
     engine_state = EngineState.default()
-    rng = TraceRNG(seed=123)  # Different seed for variety
+    rng = TraceRNG(seed=123, trace_enabled=False)  # Different seed for variety
     
     # Load content
     entries = load_pack("data/core_complications.json")
     
     # Define factions for this campaign
-    print("[Campaign Setup]")
-    print("Factions defined:")
-    print("  • city_watch: Local law enforcement")
-    print("  • merchant_guild: Economic interests")
-    print("  • underground: Criminal network")
-    print()
+    emit("[Campaign Setup]")
+    emit("Factions defined:")
+    emit("  • city_watch: Local law enforcement")
+    emit("  • merchant_guild: Economic interests")
+    emit("  • underground: Criminal network")
+    emit("")
     
     # Campaign sequence with explicit consequences
     scenes: List[tuple[str, ScenePhase, str, RarityMode, List[str], Optional[List[Scar]]]] = [
@@ -98,43 +106,45 @@ def run_v02_demo():
         "opportunity", "information"
     ]
     
+    flush()
+    
     for scene_num, (scene_name, phase, env, rarity, factions, explicit_scars) in enumerate(scenes, 1):
-        print(f"\n{'═' * 80}")
-        print(f"{scene_name}")
-        print(f"Phase: {phase} | Environment: {env} | Rarity: {rarity}")
-        print(f"{'═' * 80}")
+        emit(f"\n{'═' * 80}")
+        emit(f"{scene_name}")
+        emit(f"Phase: {phase} | Environment: {env} | Rarity: {rarity}")
+        emit(f"{'═' * 80}")
         
         # Show campaign state
-        print(f"\n[Campaign State]")
-        print(f"  Pressure: {campaign_state.campaign_pressure} ({campaign_state.get_pressure_band()})")
-        print(f"  Heat: {campaign_state.heat} ({campaign_state.get_heat_band()})")
+        emit(f"\n[Campaign State]")
+        emit(f"  Pressure: {campaign_state.campaign_pressure} ({campaign_state.get_pressure_band()})")
+        emit(f"  Heat: {campaign_state.heat} ({campaign_state.get_heat_band()})")
         
         if campaign_state.scars:
-            print(f"  Scars:")
+            emit(f"  Scars:")
             for scar in campaign_state.scars:
-                print(f"    • {scar.scar_id} ({scar.category}, {scar.severity})")
+                emit(f"    • {scar.scar_id} ({scar.category}, {scar.severity})")
                 if scar.notes:
-                    print(f"      {scar.notes}")
+                    emit(f"      {scar.notes}")
         else:
-            print(f"  Scars: None")
+            emit(f"  Scars: None")
         
         if campaign_state.factions:
-            print(f"  Factions:")
+            emit(f"  Factions:")
             for fid, faction in campaign_state.factions.items():
                 disp_str = {-2: "hostile", -1: "unfriendly", 0: "neutral", 1: "friendly", 2: "allied"}[faction.disposition]
-                print(f"    • {fid}: attention={faction.attention}, {disp_str}")
+                emit(f"    • {fid}: attention={faction.attention}, {disp_str}")
         else:
-            print(f"  Factions: None tracked yet")
+            emit(f"  Factions: None tracked yet")
         
         # Get influence
         influence = get_campaign_influence(campaign_state)
         
         if influence["notes"]:
-            print(f"\n[Campaign Influence]")
+            emit(f"\n[Campaign Influence]")
             for note in influence["notes"]:
-                print(f"  • {note}")
+                emit(f"  • {note}")
             if influence["suggested_factions_involved"]:
-                print(f"  Suggested factions: {influence['suggested_factions_involved']}")
+                emit(f"  Suggested factions: {influence['suggested_factions_involved']}")
         
         # Build scene with campaign influence
         context = SceneContext(
@@ -166,48 +176,39 @@ def run_v02_demo():
         )
         
         # Show outcome
-        print(f"\n[Scene Outcome]")
-        print(f"  {event.title} (severity {event.severity})")
+        emit(f"\n[Scene Outcome]")
+        emit(f"  {event.title} (severity {event.severity})")
         if event.cutoff_applied:
-            print(f"  Cutoff: {event.cutoff_resolution}")
-        print(f"  Tags: {', '.join(event.tags[:4])}")  # First 4 tags
+            emit(f"  Cutoff: {event.cutoff_resolution}")
+        emit(f"  Tags: {', '.join(event.tags[:4])}")  # First 4 tags
         
         # Update engine state
         from spar_engine.state import apply_state_delta, tick_state
         engine_state = apply_state_delta(engine_state, event.state_delta)
         engine_state = tick_state(engine_state, ticks=2)
         
-        # Derive campaign delta
-        ev_dict = {
-            "threat": event.effect_vector.threat,
-            "cost": event.effect_vector.cost,
-            "heat": event.effect_vector.heat,
-            "time_pressure": event.effect_vector.time_pressure,
-            "information": event.effect_vector.information,
-            "opportunity": event.effect_vector.opportunity,
-        }
-        
+        # Derive campaign delta (the typed effect vector is passed as-is)
         delta = CampaignDelta.from_scene_outcome(
             severity=event.severity,
             cutoff_applied=event.cutoff_applied,
             tags=event.tags,
-            effect_vector_dict=ev_dict,
+            effect_vector_dict=event.effect_vector,
             factions_present=factions,
             explicit_scars=explicit_scars,
         )
         
         # Show delta
-        print(f"\n[Campaign Delta]")
-        print(f"  Pressure +{delta.campaign_pressure_add}, Heat +{delta.heat_add}")
+        emit(f"\n[Campaign Delta]")
+        emit(f"  Pressure +{delta.campaign_pressure_add}, Heat +{delta.heat_add}")
         if delta.scars_add:
-            print(f"  Scars added:")
+            emit(f"  Scars added:")
             for scar in delta.scars_add:
-                print(f"    • {scar.scar_id}")
+                emit(f"    • {scar.scar_id}")
         if delta.faction_updates:
-            print(f"  Faction updates:")
+            emit(f"  Faction updates:")
             for fid, updates in delta.faction_updates.items():
                 if updates["attention_add"] > 0:
-                    print(f"    • {fid}: attention +{updates['attention_add']}")
+                    emit(f"    • {fid}: attention +{updates['attention_add']}")
         
         # Apply delta
         campaign_state = apply_campaign_delta(campaign_state, delta)
@@ -215,42 +216,45 @@ def run_v02_demo():
         
         # Aftermath decay
         if phase == "aftermath":
-            print(f"\n[Aftermath Decay: Pressure -3, Heat -2]")
+            emit(f"\n[Aftermath Decay: Pressure -3, Heat -2]")
             campaign_state = decay_campaign_state(campaign_state, pressure_decay=3, heat_decay=2)
+        
+        flush()
     
     # Final summary
-    print(f"\n\n{'═' * 80}")
-    print("CAMPAIGN SUMMARY")
-    print(f"{'═' * 80}")
-    print(f"Total Scenes: {campaign_state.total_scenes_run}")
-    print(f"Campaign Pressure: {campaign_state.campaign_pressure} ({campaign_state.get_pressure_band()})")
-    print(f"Heat: {campaign_state.heat} ({campaign_state.get_heat_band()})")
-    print(f"Peak Severity: {campaign_state.highest_severity_seen}")
+    emit(f"\n\n{'═' * 80}")
+    emit("CAMPAIGN SUMMARY")
+    emit(f"{'═' * 80}")
+    emit(f"Total Scenes: {campaign_state.total_scenes_run}")
+    emit(f"Campaign Pressure: {campaign_state.campaign_pressure} ({campaign_state.get_pressure_band()})")
+    emit(f"Heat: {campaign_state.heat} ({campaign_state.get_heat_band()})")
+    emit(f"Peak Severity: {campaign_state.highest_severity_seen}")
     
-    print(f"\n[Persistent Scars]")
+    emit(f"\n[Persistent Scars]")
     if campaign_state.scars:
         for scar in campaign_state.scars:
-            print(f"  • {scar.scar_id} ({scar.category}, {scar.severity})")
-            print(f"    {scar.notes}")
+            emit(f"  • {scar.scar_id} ({scar.category}, {scar.severity})")
+            emit(f"    {scar.notes}")
     else:
-        print(f"  None")
+        emit(f"  None")
     
-    print(f"\n[Faction States]")
+    emit(f"\n[Faction States]")
     if campaign_state.factions:
         for fid, faction in campaign_state.factions.items():
             disp_str = {-2: "hostile", -1: "unfriendly", 0: "neutral", 1: "friendly", 2: "allied"}[faction.disposition]
-            print(f"  • {fid}: attention={faction.attention}/20, {disp_str}")
+            emit(f"  • {fid}: attention={faction.attention}/20, {disp_str}")
     else:
-        print(f"  None")
+        emit(f"  None")
     
-    print(f"\n[Key Observations - v0.2 Features]")
-    print(f"✓ Scars persisted across all scenes (Scene 4, 7)")
-    print(f"✓ Scars influenced later scene tags (resource scar → attrition)")
-    print(f"✓ Factions accumulated attention from visibility/social tags")
-    print(f"✓ Long-arc bands provided human-readable state descriptors")
-    print(f"✓ Backward compatibility maintained (v0.1 can upgrade to v0.2)")
-    print(f"✓ Engine internals completely unchanged")
-    print()
+    emit(f"\n[Key Observations - v0.2 Features]")
+    emit(f"✓ Scars persisted across all scenes (Scene 4, 7)")
+    emit(f"✓ Scars influenced later scene tags (resource scar → attrition)")
+    emit(f"✓ Factions accumulated attention from visibility/social tags")
+    emit(f"✓ Long-arc bands provided human-readable state descriptors")
+    emit(f"✓ Backward compatibility maintained (v0.1 can upgrade to v0.2)")
+    emit(f"✓ Engine internals completely unchanged")
+    emit("")
+    flush()
 
 
 if __name__ == "__main__":
@@ -11,11 +11,55 @@ of campaign state into scene setup influences.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Set
+from bisect import bisect_right
+from dataclasses import replace
+from functools import lru_cache
+from typing import Any, Dict, List, Set, Tuple
 
 from .models import CampaignState, CampaignDelta, FactionState, Scar
 
 
+# Threshold rules for get_campaign_influence, indexed by bisect_right over
+# the thresholds: (include_tags, rarity_bias, note) for each tier.
+_PRESSURE_THRESHOLDS = (10, 20)
+_PRESSURE_RULES = (
+    ((), None, None),
+    (("time_pressure",), None, "Elevated campaign pressure: situation remains tense"),
+    (("time_pressure", "reinforcements"), "spiky", "Very high campaign pressure: volatile conditions likely"),
+)
+_HEAT_THRESHOLDS = (8, 15)
+_HEAT_RULES = (
+    ((), None, None),
+    (("visibility",), None, "Moderate heat: attention is building"),
+    (("social_friction", "visibility"), None, "High heat: authorities and factions are aware"),
+)
+
+
+# Scar category -> (include tag, note suffix); categories not listed add nothing
+_SCAR_CATEGORY_INFLUENCE = {
+    "resource": ("attrition", "supply pressure continues"),
+    "social": ("social_friction", "social complications likely"),
+    "political": ("social_friction", "social complications likely"),
+    "reputation": ("social_friction", "social complications likely"),
+}
+
+
+@lru_cache(maxsize=128)
+def _scar_influence(scars: Tuple[Scar, ...]) -> Tuple[Tuple[str, str], ...]:
+    """(include_tag, note) pairs contributed by structured scars, in scar order.
+
+    Scars only change through apply_campaign_delta, so consecutive calls on
+    the same campaign share one categorization pass.
+    """
+    influence: List[Tuple[str, str]] = []
+    for scar in scars:
+        rule = _SCAR_CATEGORY_INFLUENCE.get(scar.category)
+        if rule is not None:
+            tag, suffix = rule
+            influence.append((tag, f"Scar: {scar.scar_id} - {suffix}"))
+    return tuple(influence)
+
+
 def apply_campaign_delta(
     state: CampaignState,
     delta: CampaignDelta,
@@ -46,19 +90,21 @@ def apply_campaign_delta(
         heat_cap
     )
     
-    # Add new scars (irreversible, no duplicates by scar_id)
-    existing_scar_ids = {s.scar_id for s in state.scars}
-    new_scars = list(state.scars)
-    for scar in delta.scars_add:
-        if scar.scar_id not in existing_scar_ids:
-            new_scars.append(scar)
+    # Add new scars (irreversible, no duplicates by scar_id; first one wins).
+    # Most deltas add none, in which case the existing tuple is shared.
+    new_scars = state.scars
+    if delta.scars_add:
+        merged = {s.scar_id: s for s in state.scars}
+        for scar in delta.scars_add:
+            merged.setdefault(scar.scar_id, scar)
+        new_scars = tuple(merged.values())
     
-    # Update factions
-    new_factions = dict(state.factions)
+    # Update factions (the mapping is shared when no faction actually changes)
+    new_factions = state.factions
     for faction_id, updates in delta.faction_updates.items():
-        if faction_id in new_factions:
+        old_faction = state.factions.get(faction_id)
+        if old_faction is not None:
             # Update existing faction
-            old_faction = new_factions[faction_id]
             new_attention = min(
                 old_faction.attention + updates.get("attention_add", 0),
                 20  # faction attention cap
@@ -66,7 +112,9 @@ def apply_campaign_delta(
             new_disposition = max(-2, min(2,
                 old_faction.disposition + updates.get("disposition_add", 0)
             ))
-            new_factions[faction_id] = FactionState(
+            if new_attention == old_faction.attention and new_disposition == old_faction.disposition:
+                continue
+            faction = FactionState(
                 faction_id=faction_id,
                 attention=new_attention,
                 disposition=new_disposition,
@@ -74,21 +122,23 @@ def apply_campaign_delta(
             )
         else:
             # Create new faction
-            new_factions[faction_id] = FactionState(
+            faction = FactionState(
                 faction_id=faction_id,
                 attention=updates.get("attention_add", 0),
                 disposition=updates.get("disposition_add", 0),
                 notes=None,
             )
-    
-    # Track highest severity seen
-    new_highest = state.highest_severity_seen
+        if new_factions is state.factions:
+            new_factions = dict(state.factions)
+        new_factions[faction_id] = faction
     
     # Increment counters
     new_scenes = state.total_scenes_run + delta.scenes_increment
     new_cutoffs = state.total_cutoffs_seen + (1 if delta.campaign_pressure_add >= 2 else 0)
     
-    return CampaignState(
+    # highest_severity_seen and legacy scars carry over unchanged
+    return replace(
+        state,
         version="0.2",
         campaign_pressure=new_pressure,
         heat=new_heat,
@@ -96,8 +146,6 @@ def apply_campaign_delta(
         factions=new_factions,
         total_scenes_run=new_scenes,
         total_cutoffs_seen=new_cutoffs,
-        highest_severity_seen=new_highest,
-        _legacy_scars=state._legacy_scars,  # Preserve legacy
     )
 
 
@@ -125,119 +173,146 @@ def decay_campaign_state(
     new_pressure = max(0, state.campaign_pressure - pressure_decay)
     new_heat = max(0, state.heat - heat_decay)
     
-    return CampaignState(
-        version="0.2",
-        campaign_pressure=new_pressure,
-        heat=new_heat,
-        scars=state.scars,  # Unchanged
-        factions=state.factions,  # Unchanged
-        total_scenes_run=state.total_scenes_run,
-        total_cutoffs_seen=state.total_cutoffs_seen,
-        highest_severity_seen=state.highest_severity_seen,
-        _legacy_scars=state._legacy_scars,
-    )
+    # Scars, factions and counters are unchanged
+    return replace(state, version="0.2", campaign_pressure=new_pressure, heat=new_heat)
 
 
-def get_campaign_influence(state: CampaignState) -> Dict[str, Any]:
+def get_campaign_influence(state: CampaignState, *, verbose: bool = True) -> Dict[str, Any]:
     """Translate campaign state into scene setup influence.
     
     This function provides hints for scene setup without modifying
     engine internals. The calling code decides how to apply these hints.
     
     Returns dictionary with:
-        - include_tags: Tags to add to scene selection
-        - exclude_tags: Tags to suppress
+        - include_tags: Tags to add to scene selection (unique, in rule order)
+        - exclude_tags: Tags to suppress (unique)
         - rarity_bias: Suggested shift to rarity mode (if any)
-        - notes: Human-readable explanation
+        - notes: Human-readable explanation (empty when verbose=False)
+    
+    Callers that only consume tags/bands can pass verbose=False to skip
+    building the note strings.
+    
+    Results are memoized on the state's values (see _campaign_influence);
+    each call still returns fresh lists, so callers may mutate them.
     
     Design principle: Campaign state suggests, scene setup decides.
     """
+    pressure_band = state.get_pressure_band()
+    heat_band = state.get_heat_band()
+    include_tags, exclude_tags, rarity_bias, notes, suggested_factions = _campaign_influence(
+        state.campaign_pressure,
+        state.heat,
+        state.scars,
+        "resources_depleted" in state._legacy_scars,
+        "known_to_authorities" in state._legacy_scars,
+        tuple((fid, f.attention, f.disposition) for fid, f in state.factions.items()),
+        pressure_band,
+        heat_band,
+        verbose,
+    )
+    return {
+        "include_tags": list(include_tags),
+        "exclude_tags": list(exclude_tags),
+        "rarity_bias": rarity_bias,
+        "notes": list(notes),
+        "suggested_factions_involved": list(suggested_factions),
+        "pressure_band": pressure_band,
+        "heat_band": heat_band,
+    }
+
+
+@lru_cache(maxsize=128)
+def _campaign_influence(
+    campaign_pressure: int,
+    heat: int,
+    scars: Tuple[Scar, ...],
+    resources_depleted: bool,
+    known_to_authorities: bool,
+    factions: Tuple[Tuple[str, int, int], ...],
+    pressure_band: str,
+    heat_band: str,
+    verbose: bool,
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], str | None, Tuple[str, ...], Tuple[str, ...]]:
+    """Rule evaluation behind get_campaign_influence.
+    
+    CampaignState itself is unhashable (factions dict, legacy scar set), so
+    the cache is keyed on the handful of values the rules actually read;
+    factions are passed as (faction_id, attention, disposition) triples.
+    """
     include_tags: List[str] = []
     exclude_tags: List[str] = []
-    rarity_bias: str | None = None
+    rarity_bias: str | None
     notes: List[str] = []
     
     # High campaign pressure suggests more volatility
-    if state.campaign_pressure >= 20:
-        include_tags.append("time_pressure")
-        include_tags.append("reinforcements")
-        rarity_bias = "spiky"
-        notes.append("Very high campaign pressure: volatile conditions likely")
-    elif state.campaign_pressure >= 10:
-        include_tags.append("time_pressure")
-        notes.append("Elevated campaign pressure: situation remains tense")
+    tags, rarity_bias, note = _PRESSURE_RULES[bisect_right(_PRESSURE_THRESHOLDS, campaign_pressure)]
+    include_tags.extend(tags)
+    if verbose and note:
+        notes.append(note)
     
     # High heat means attention and response
-    if state.heat >= 15:
-        include_tags.append("social_friction")
-        include_tags.append("visibility")
-        notes.append("High heat: authorities and factions are aware")
-    elif state.heat >= 8:
-        include_tags.append("visibility")
-        notes.append("Moderate heat: attention is building")
+    tags, _, note = _HEAT_RULES[bisect_right(_HEAT_THRESHOLDS, heat)]
+    include_tags.extend(tags)
+    if verbose and note:
+        notes.append(note)
     
     # Low pressure + low heat might allow breathing room
-    if state.campaign_pressure < 5 and state.heat < 5:
+    if campaign_pressure < 5 and heat < 5:
         exclude_tags.append("time_pressure")
-        notes.append("Low pressure: opportunity for recovery")
+        if verbose:
+            notes.append("Low pressure: opportunity for recovery")
     
     # Specific scars might enable/disable certain content (v0.2)
-    for scar in state.scars:
-        if scar.category == "resource":
-            include_tags.append("attrition")
-            notes.append(f"Scar: {scar.scar_id} - supply pressure continues")
-        
-        if scar.category in ["social", "political", "reputation"]:
-            include_tags.append("social_friction")
-            notes.append(f"Scar: {scar.scar_id} - social complications likely")
+    scar_influence = _scar_influence(scars)
+    include_tags.extend(tag for tag, _ in scar_influence)
+    if verbose:
+        notes.extend(note for _, note in scar_influence)
     
     # v0.1 legacy scar support
-    if "resources_depleted" in state._legacy_scars:
+    if resources_depleted:
         include_tags.append("attrition")
-        notes.append("Resources depleted: supply pressure continues")
+        if verbose:
+            notes.append("Resources depleted: supply pressure continues")
     
-    if "known_to_authorities" in state._legacy_scars:
+    if known_to_authorities:
         include_tags.append("social_friction")
-        notes.append("Known to authorities: heightened scrutiny")
+        if verbose:
+            notes.append("Known to authorities: heightened scrutiny")
     
-    # Faction influence (v0.2)
-    high_attention_factions = [
-        fid for fid, f in state.factions.items() if f.attention >= 10
-    ]
-    hostile_factions = [
-        fid for fid, f in state.factions.items() if f.disposition <= -1
-    ]
+    # Faction influence (v0.2); one pass over the faction triples
+    high_attention_factions: List[str] = []
+    hostile_factions: List[str] = []
+    suggested_factions: List[str] = []
+    for fid, attention, disposition in factions:
+        if attention >= 10:
+            high_attention_factions.append(fid)
+        if attention >= 5:
+            suggested_factions.append(fid)
+        if disposition <= -1:
+            hostile_factions.append(fid)
     
     if high_attention_factions:
         include_tags.append("reinforcements")
-        notes.append(f"High faction attention: {', '.join(high_attention_factions)}")
+        if verbose:
+            notes.append(f"High faction attention: {', '.join(high_attention_factions)}")
     
     if hostile_factions:
         include_tags.append("social_friction")
-        notes.append(f"Hostile factions: {', '.join(hostile_factions)}")
+        if verbose:
+            notes.append(f"Hostile factions: {', '.join(hostile_factions)}")
     
     # Add pressure and heat band descriptors
-    pressure_band = state.get_pressure_band()
-    heat_band = state.get_heat_band()
-    
-    if pressure_band != "stable" or heat_band != "quiet":
+    if verbose and (pressure_band != "stable" or heat_band != "quiet"):
         notes.append(f"Campaign state: {pressure_band} pressure, {heat_band} heat")
     
-    # Suggest factions that might be involved based on state
-    suggested_factions = []
-    for fid, faction in state.factions.items():
-        if faction.attention >= 5:
-            suggested_factions.append(fid)
-    
-    return {
-        "include_tags": include_tags,
-        "exclude_tags": exclude_tags,
-        "rarity_bias": rarity_bias,
-        "notes": notes,
-        "suggested_factions_involved": suggested_factions,
-        "pressure_band": pressure_band,
-        "heat_band": heat_band,
-    }
+    # Several rules suggest the same tag; report each once, first rule first
+    return (
+        tuple(dict.fromkeys(include_tags)),
+        tuple(dict.fromkeys(exclude_tags)),
+        rarity_bias,
+        tuple(notes),
+        tuple(suggested_factions),
+    )
 
 
 def record_severity_high_water_mark(
@@ -249,15 +324,5 @@ def record_severity_high_water_mark(
     Helper function to track campaign volatility peak.
     """
     if severity > state.highest_severity_seen:
-        return CampaignState(
-            version="0.2",
-            campaign_pressure=state.campaign_pressure,
-            heat=state.heat,
-            scars=state.scars,
-            factions=state.factions,
-            total_scenes_run=state.total_scenes_run,
-            total_cutoffs_seen=state.total_cutoffs_seen,
-            highest_severity_seen=severity,
-            _legacy_scars=state._legacy_scars,
-        )
+        return replace(state, version="0.2", highest_severity_seen=severity)
     return state
@@ -11,8 +11,14 @@ timescale than scene-level clocks.
 
 from __future__ import annotations
 
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import Dict, List, Literal, Optional, Set
+from typing import Any, Callable, Dict, List, Literal, Mapping, Optional, Set, Tuple, Union
+
+# Campaign records are rebuilt on every delta/decay; on Python 3.10+ they drop
+# the per-instance __dict__ (dataclass slots=True is unavailable on 3.9).
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 # Type aliases for v0.2
 ScarCategory = Literal["physical", "social", "political", "resource", "reputation", "environment"]
@@ -20,8 +26,17 @@ ScarSeverity = Literal["low", "medium", "high"]
 PressureBand = Literal["stable", "strained", "volatile", "critical"]
 HeatBand = Literal["quiet", "noticed", "hunted", "exposed"]
 
+# Band lower bounds; bisect_right over these indexes the band name tuples
+_PRESSURE_BAND_THRESHOLDS = (5, 10, 20)
+_PRESSURE_BANDS = ("stable", "strained", "volatile", "critical")
+_HEAT_BAND_THRESHOLDS = (4, 8, 15)
+_HEAT_BANDS = ("quiet", "noticed", "hunted", "exposed")
+
+# Event tags that spread attention (heat) in CampaignDelta.from_scene_outcome
+_VISIBILITY_TAGS = frozenset(("visibility", "social_friction", "reinforcements"))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **_SLOTS)
 class Scar:
     """Structured scar representing persistent campaign consequence.
     
@@ -37,6 +52,10 @@ class Scar:
     created_scene_index: Optional[int] = None
     notes: Optional[str] = None
     
+    def __post_init__(self) -> None:
+        # Interned so scar-id sets/dicts hash and compare by identity
+        object.__setattr__(self, "scar_id", sys.intern(self.scar_id))
+    
     def to_dict(self) -> Dict:
         """Serialize to dictionary."""
         return {
@@ -61,7 +80,7 @@ class Scar:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class FactionState:
     """Tracks a faction's attention and disposition toward the party.
     
@@ -76,6 +95,10 @@ class FactionState:
     disposition: int = 0  # How they feel (-2 hostile, 0 neutral, +2 favorable)
     notes: Optional[str] = None
     
+    def __post_init__(self) -> None:
+        # Interned like Scar.scar_id; faction ids key CampaignState.factions
+        object.__setattr__(self, "faction_id", sys.intern(self.faction_id))
+    
     def to_dict(self) -> Dict:
         """Serialize to dictionary."""
         return {
@@ -96,7 +119,7 @@ class FactionState:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class CampaignState:
     """Campaign-level state tracking long-term pressure and consequences.
     
@@ -120,8 +143,10 @@ class CampaignState:
     # External awareness and response tracking
     heat: int = 0
     
-    # Structured scars (v0.2) - permanent consequences
-    scars: List[Scar] = field(default_factory=list)
+    # Structured scars (v0.2) - permanent consequences.
+    # Stored as a tuple (lists are accepted and frozen in __post_init__) so
+    # the scar sequence is hashable and can key cached derivations.
+    scars: Tuple[Scar, ...] = ()
     
     # Faction tracking (v0.2) - external actors
     factions: Dict[str, FactionState] = field(default_factory=dict)
@@ -134,6 +159,10 @@ class CampaignState:
     # v0.1 compatibility: legacy scars (deprecated, use structured scars)
     _legacy_scars: Set[str] = field(default_factory=set)
     
+    def __post_init__(self) -> None:
+        if not isinstance(self.scars, tuple):
+            object.__setattr__(self, "scars", tuple(self.scars))
+    
     @staticmethod
     def default() -> "CampaignState":
         """Create default campaign state with zero pressure."""
@@ -141,7 +170,7 @@ class CampaignState:
             version="0.2",
             campaign_pressure=0,
             heat=0,
-            scars=[],
+            scars=(),
             factions={},
             total_scenes_run=0,
             total_cutoffs_seen=0,
@@ -167,60 +196,58 @@ class CampaignState:
         """Deserialize from dictionary with backward compatibility.
         
         Supports loading v0.1 state (string scars) and v0.2 state (structured).
+        Older payloads are first upgraded step by step via _UPGRADERS.
         """
         version = data.get("version", "0.1")
-        
-        # Load scars with version compatibility
         scars_data = data.get("scars", [])
-        if version == "0.1" or (scars_data and isinstance(scars_data[0], str)):
-            # v0.1 format: list of strings, store in legacy field
-            scars = []
-            legacy_scars = set(scars_data)
-        else:
-            # v0.2 format: list of dicts
-            scars = [Scar.from_dict(s) for s in scars_data]
-            legacy_scars = set()
+        if scars_data and isinstance(scars_data[0], str):
+            version = "0.1"  # string scars are v0.1 regardless of the label
+        while version in _UPGRADERS:
+            data = _UPGRADERS[version](data)
+            version = data["version"]
         
         # Load factions (v0.2 only)
         factions_data = data.get("factions", {})
-        factions = {fid: FactionState.from_dict(f) for fid, f in factions_data.items()}
+        factions = {sys.intern(fid): FactionState.from_dict(f) for fid, f in factions_data.items()}
         
         return CampaignState(
             version="0.2",  # Always upgrade to current
             campaign_pressure=data.get("campaign_pressure", 0),
             heat=data.get("heat", 0),
-            scars=scars,
+            scars=[Scar.from_dict(s) for s in data.get("scars", [])],
             factions=factions,
             total_scenes_run=data.get("total_scenes_run", 0),
             total_cutoffs_seen=data.get("total_cutoffs_seen", 0),
             highest_severity_seen=data.get("highest_severity_seen", 0),
-            _legacy_scars=legacy_scars,
+            _legacy_scars=set(data.get("_legacy_scars", ())),
         )
     
     def get_pressure_band(self) -> PressureBand:
         """Get descriptive band for current pressure level (informational only)."""
-        if self.campaign_pressure >= 20:
-            return "critical"
-        elif self.campaign_pressure >= 10:
-            return "volatile"
-        elif self.campaign_pressure >= 5:
-            return "strained"
-        else:
-            return "stable"
+        return _PRESSURE_BANDS[bisect_right(_PRESSURE_BAND_THRESHOLDS, self.campaign_pressure)]
     
     def get_heat_band(self) -> HeatBand:
         """Get descriptive band for current heat level (informational only)."""
-        if self.heat >= 15:
-            return "exposed"
-        elif self.heat >= 8:
-            return "hunted"
-        elif self.heat >= 4:
-            return "noticed"
-        else:
-            return "quiet"
+        return _HEAT_BANDS[bisect_right(_HEAT_BAND_THRESHOLDS, self.heat)]
+
+
+def _upgrade_v0_1(data: Dict) -> Dict:
+    """v0.1 -> v0.2: string scars move to the legacy scar set."""
+    upgraded = dict(data)
+    upgraded["version"] = "0.2"
+    upgraded["_legacy_scars"] = list(data.get("scars", []))
+    upgraded["scars"] = []
+    return upgraded
 
 
-@dataclass(frozen=True)
+# Schema version -> upgrader producing the next version's payload.
+# CampaignState.from_dict applies these until it reaches the current version.
+_UPGRADERS: Dict[str, Callable[[Dict], Dict]] = {
+    "0.1": _upgrade_v0_1,
+}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class CampaignDelta:
     """Changes to apply to CampaignState after a scene resolves.
     
@@ -252,7 +279,7 @@ class CampaignDelta:
         severity: int,
         cutoff_applied: bool,
         tags: List[str],
-        effect_vector_dict: Dict[str, int],
+        effect_vector_dict: Union[Mapping[str, int], Any],
         *,
         factions_present: Optional[List[str]] = None,
         explicit_scars: Optional[List[Scar]] = None,
@@ -269,10 +296,16 @@ class CampaignDelta:
             severity: Scene severity
             cutoff_applied: Whether cutoff was triggered
             tags: Event tags
-            effect_vector_dict: Effect vector as dict
+            effect_vector_dict: Effect vector as dict, or a typed effect struct
+                with the same fields as attributes (e.g. spar_engine EffectVector)
             factions_present: Optional list of faction IDs relevant to scene
             explicit_scars: Optional list of scars to add
         """
+        if isinstance(effect_vector_dict, Mapping):
+            effect_heat = int(effect_vector_dict.get("heat", 0))
+        else:
+            effect_heat = int(getattr(effect_vector_dict, "heat", 0))
+        
         pressure = 0
         
         # High severity scenes accumulate pressure
@@ -286,34 +319,27 @@ class CampaignDelta:
         # Calculate heat from tags and effect vector
         heat_accumulation = 0
         
-        # Tags that spread attention
-        visibility_tags = ["visibility", "social_friction", "reinforcements"]
-        for tag in tags:
-            if tag in visibility_tags:
-                heat_accumulation += 1
+        # Tags that spread attention (counted per occurrence)
+        heat_accumulation += sum(1 for tag in tags if tag in _VISIBILITY_TAGS)
         
         # Add direct heat from effect vector
-        heat_accumulation += effect_vector_dict.get("heat", 0)
+        heat_accumulation += effect_heat
         
-        # Calculate faction updates (v0.2)
+        # Calculate faction updates (v0.2). The rules depend only on the
+        # scene, so every present faction gets the same attention change.
         faction_updates: Dict[str, Dict[str, int]] = {}
         if factions_present:
-            for faction_id in factions_present:
-                attention_add = 0
-                
+            tag_set = set(tags)
+            attention_add = (
                 # Visibility and social friction draw faction attention
-                if "visibility" in tags or "social_friction" in tags:
-                    attention_add += 1
-                
+                int(not tag_set.isdisjoint(("visibility", "social_friction")))
                 # Reinforcements suggest faction response
-                if "reinforcements" in tags:
-                    attention_add += 1
-                
+                + int("reinforcements" in tag_set)
                 # High heat draws attention
-                if effect_vector_dict.get("heat", 0) >= 2:
-                    attention_add += 1
-                
-                if attention_add > 0:
+                + int(effect_heat >= 2)
+            )
+            if attention_add > 0:
+                for faction_id in factions_present:
                     faction_updates[faction_id] = {
                         "attention_add": attention_add,
                         "disposition_add": 0,  # Neutral by default
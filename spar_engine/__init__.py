@@ -1,2 +1,2 @@
-from .engine import generate_event
+from .engine import generate_event, generate_events, prepare_selection
 from .state import apply_state_delta, tick_state
@@ -1,76 +1,180 @@
 from __future__ import annotations
 
+import contextlib
+import hashlib
 import json
+import os
+import pickle
+import sys
+import tempfile
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import List, Sequence
 
-from .models import ContentEntry, ScenePhase, AdapterHints
+from .models import ContentEntry, ScenePhase, AdapterHints, tags_to_mask
 
-def load_pack(path: str | Path) -> List[ContentEntry]:
-    p = Path(path)
-    data = json.loads(p.read_text())
-    entries: List[ContentEntry] = []
-    for raw in data:
-        hints = raw.get("adapter_hints")
-        adapter_hints = None
-        if hints:
-            adapter_hints = AdapterHints(
-                difficulty_hint=hints.get("difficulty_hint"),
-                scale_hint=hints.get("scale_hint"),
-                duration_hint=hints.get("duration_hint"),
-            )
-        entries.append(
-            ContentEntry(
-                event_id=raw["event_id"],
-                title=raw["title"],
-                tags=list(raw.get("tags", [])),
-                allowed_environments=list(raw.get("allowed_environments", [])),
-                allowed_scene_phases=list(raw.get("allowed_scene_phases", [])),
-                severity_band=tuple(raw.get("severity_band", [1, 10])),
-                weight=float(raw.get("weight", 1.0)),
-                cooldown_event=int(raw.get("cooldown", {}).get("event", 0)),
-                cooldown_tags=dict(raw.get("cooldown", {}).get("tags", {})),
-                effect_vector_template={k: tuple(v) for k, v in raw.get("effect_vector_template", {}).items()},
-                fiction_prompt=raw.get("fiction", {}).get("prompt", ""),
-                fiction_sensory=list(raw.get("fiction", {}).get("sensory", [])),
-                fiction_choices=list(raw.get("fiction", {}).get("immediate_choice", [])),
-                adapter_hints=adapter_hints,
-            )
+try:  # Optional speedup: orjson is a C JSON codec; stdlib json is the fallback.
+    import orjson
+except ImportError:  # pragma: no cover - exercised only when orjson is absent
+    orjson = None
+
+def _entry_from_raw(raw: dict) -> ContentEntry:
+    hints = raw.get("adapter_hints")
+    adapter_hints = None
+    if hints:
+        adapter_hints = AdapterHints(
+            difficulty_hint=hints.get("difficulty_hint"),
+            scale_hint=hints.get("scale_hint"),
+            duration_hint=hints.get("duration_hint"),
         )
+    # Nested sections are looked up once each, not once per field
+    cooldown = raw.get("cooldown") or {}
+    fiction = raw.get("fiction") or {}
+    return ContentEntry(
+        event_id=raw["event_id"],
+        title=raw["title"],
+        tags=list(raw.get("tags", [])),
+        allowed_environments=list(raw.get("allowed_environments", [])),
+        allowed_scene_phases=list(raw.get("allowed_scene_phases", [])),
+        severity_band=tuple(raw.get("severity_band", [1, 10])),
+        weight=float(raw.get("weight", 1.0)),
+        cooldown_event=int(cooldown.get("event", 0)),
+        cooldown_tags=dict(cooldown.get("tags", {})),
+        effect_vector_template={k: tuple(v) for k, v in raw.get("effect_vector_template", {}).items()},
+        fiction_prompt=fiction.get("prompt", ""),
+        fiction_sensory=list(fiction.get("sensory", [])),
+        fiction_choices=list(fiction.get("immediate_choice", [])),
+        adapter_hints=adapter_hints,
+    )
+
+def _parse_pack(data: bytes) -> List[ContentEntry]:
+    # Bytes in both branches: JSON is UTF-8 regardless of the locale
+    raw_entries = orjson.loads(data) if orjson is not None else json.loads(data)
+    return [_entry_from_raw(raw) for raw in raw_entries]
+
+def load_pack(path: str | Path) -> List[ContentEntry]:
+    """Load a JSON content pack into ContentEntry objects."""
+    return _parse_pack(Path(path).read_bytes())
+
+# Bump when ContentEntry's shape or pickle format changes so stale caches are
+# rebuilt. The interpreter version is part of the key as well: dataclass
+# pickling differs between Python releases.
+_PACK_CACHE_VERSION = 3
+
+
+def _pack_cache_dir() -> Path:
+    """Per-user directory for parsed-pack caches.
+
+    $SPAR_CACHE_DIR if set, else `spar_engine/packs` under %LOCALAPPDATA%
+    (Windows) or $XDG_CACHE_HOME / ~/.cache.
+    """
+    override = os.environ.get("SPAR_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("LOCALAPPDATA") if sys.platform == "win32" else os.environ.get("XDG_CACHE_HOME")
+    return Path(base or Path.home() / ".cache") / "spar_engine" / "packs"
+
+def load_pack_cached(path: str | Path, *, cache_dir: str | Path | None = None) -> List[ContentEntry]:
+    """Load a content pack through a pickled copy in the user's cache directory.
+
+    The cache is keyed on a SHA-256 of the pack's bytes plus the cache format
+    and Python version, so any change to the pack rebuilds it. It lives in
+    `cache_dir` (default: `_pack_cache_dir()`), never next to the pack, so a
+    pickle shipped alongside a shared pack is never loaded. Cache problems
+    (unreadable, truncated or stale file, read-only directory) fall back to
+    parsing the JSON.
+    """
+    data = Path(path).read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    py = sys.version_info[:2]
+    key = (_PACK_CACHE_VERSION, py, digest)
+    cache = Path(cache_dir or _pack_cache_dir()) / f"{digest}.v{_PACK_CACHE_VERSION}.py{py[0]}{py[1]}.pkl"
+    try:
+        with cache.open("rb") as f:
+            if pickle.load(f) == key:
+                return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        pass
+
+    entries = _parse_pack(data)
+    try:
+        cache.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _write_pack_cache(cache, key, entries)
+    except OSError:
+        pass
     return entries
 
-def _any_tag_on_cooldown(entry: ContentEntry, tag_cooldowns: dict[str, int]) -> bool:
-    for t in entry.tags:
-        if tag_cooldowns.get(t, 0) > 0:
-            return True
-    return False
+def _write_pack_cache(cache: Path, key: tuple, entries: List[ContentEntry]) -> None:
+    """Write the cache via a temp file + os.replace, so readers (and a
+    crash mid-write) never see a partial pickle."""
+    fd, tmp = tempfile.mkstemp(dir=cache.parent, prefix=cache.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(key, f, protocol=5)
+            pickle.dump(entries, f, protocol=5)
+        os.replace(tmp, cache)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
 
-def filter_entries(
+def _cooldown_mask(tag_cooldowns: dict[str, int]) -> int:
+    """Bitmask of the tags whose cooldown is still running."""
+    return tags_to_mask((t for t, turns in tag_cooldowns.items() if turns > 0), register=False)
+
+def filter_static(
     entries: Sequence[ContentEntry],
-    environment: List[str],
+    environment: Sequence[str],
     phase: ScenePhase,
-    include_tags: List[str],
-    exclude_tags: List[str],
-    recent_event_ids: List[str],
-    tag_cooldowns: dict[str, int],
+    include_tags: Sequence[str],
+    exclude_tags: Sequence[str],
 ) -> List[ContentEntry]:
+    """Filter on scene/selection inputs only (no EngineState).
+
+    The result is stable for a given scene + selection, so callers generating
+    several events can compute it once and apply `filter_available` per event.
+    """
     env_set = set(environment)
-    include_set = set(include_tags) if include_tags else None
-    exclude_set = set(exclude_tags) if exclude_tags else set()
+    include_mask = tags_to_mask(include_tags, register=False) if include_tags else None
+    exclude_mask = tags_to_mask(exclude_tags, register=False) if exclude_tags else 0
 
     out: List[ContentEntry] = []
     for e in entries:
-        if e.event_id in set(recent_event_ids):
-            continue
-        if exclude_set and (exclude_set.intersection(e.tags)):
+        if e.tag_mask & exclude_mask:
             continue
-        if include_set is not None and not include_set.intersection(e.tags):
+        if include_mask is not None and not e.tag_mask & include_mask:
             continue
         if e.allowed_scene_phases and phase not in e.allowed_scene_phases:
             continue
-        if e.allowed_environments and not env_set.intersection(e.allowed_environments):
+        if e.allowed_environments and env_set.isdisjoint(e.allowed_environments):
             continue
-        if _any_tag_on_cooldown(e, tag_cooldowns):
+        out.append(e)
+    return out
+
+def filter_available(
+    entries: Sequence[ContentEntry],
+    recent_event_ids: List[str],
+    tag_cooldowns: dict[str, int],
+) -> List[ContentEntry]:
+    """Filter on EngineState: drop recently used entries and tags on cooldown."""
+    recent = set(recent_event_ids)
+    cooldown_mask = _cooldown_mask(tag_cooldowns)
+    out: List[ContentEntry] = []
+    for e in entries:
+        if e.event_id in recent:
+            continue
+        if e.tag_mask & cooldown_mask:
             continue
         out.append(e)
     return out
+
+def filter_entries(
+    entries: Sequence[ContentEntry],
+    environment: Sequence[str],
+    phase: ScenePhase,
+    include_tags: Sequence[str],
+    exclude_tags: Sequence[str],
+    recent_event_ids: List[str],
+    tag_cooldowns: dict[str, int],
+) -> List[ContentEntry]:
+    static = filter_static(entries, environment, phase, include_tags, exclude_tags)
+    return filter_available(static, recent_event_ids, tag_cooldowns)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from .content import filter_entries
+from .content import filter_available, filter_static
 from .cutoff import apply_cutoff
 from .models import (
     ContentEntry,
@@ -10,12 +10,42 @@ from .models import (
     EngineEvent,
     EngineState,
     Fiction,
+    PreparedSelection,
     SceneContext,
     SelectionContext,
     StateDelta,
+    tags_to_mask,
 )
 from .rng import TraceRNG
-from .severity import compute_alpha, compute_severity_cap, sample_severity
+from .severity import compute_alpha, compute_severity_cap, sample_severity, severity_weights
+from .state import apply_state_delta
+
+
+# Adaptive weighting (v0.2): tiered recency penalties, indexed by position in
+# recent_event_ids (0 = most recent). Stronger for very recent, gentler for
+# older; anything past the table but still in the window gets the tail value.
+_RECENCY_PENALTIES = (
+    10.0,  # just occurred
+    6.0,
+    4.0,
+    3.0, 3.0,
+    2.0, 2.0,
+)
+_RECENCY_PENALTY_TAIL = 1.5  # old but still in window
+
+
+def _adaptive_weights(pool: Sequence[ContentEntry], recent_event_ids: Sequence[str]) -> List[float]:
+    """Reduce "sticky" outcomes without hard-banning them."""
+    weights = [float(e.weight) for e in pool]
+    if not recent_event_ids:
+        return weights
+    # event_id -> position in the recent window (0 = most recent)
+    recency_index = {eid: i for i, eid in enumerate(recent_event_ids)}
+    n_tiers = len(_RECENCY_PENALTIES)
+    for j, i in enumerate(map(recency_index.get, [e.event_id for e in pool])):
+        if i is not None:
+            weights[j] = weights[j] / (_RECENCY_PENALTIES[i] if i < n_tiers else _RECENCY_PENALTY_TAIL)
+    return weights
 
 
 def _roll_effect_vector(entry: ContentEntry, rng: TraceRNG) -> EffectVector:
@@ -38,17 +68,20 @@ def _roll_effect_vector(entry: ContentEntry, rng: TraceRNG) -> EffectVector:
     )
 
 
+# Entries carrying any of these tags can raise the heat clock
+_HEAT_TAGS_MASK = tags_to_mask(("reinforcements", "visibility"))
+
+# Minimum severity that ticks the tension clock, per phase (aftermath never does)
+_TENSION_SEVERITY_BY_PHASE: Dict[str, int] = {"engage": 3, "approach": 5}
+
+
 def _derive_state_delta(scene: SceneContext, state: EngineState, entry: ContentEntry, severity: int) -> StateDelta:
     clocks: Dict[str, int] = {}
 
-    if scene.scene_phase == "engage":
-        clocks["tension"] = 1 if severity >= 3 else 0
-    elif scene.scene_phase == "approach":
-        clocks["tension"] = 1 if severity >= 5 else 0
-    else:
-        clocks["tension"] = 0
+    threshold = _TENSION_SEVERITY_BY_PHASE.get(scene.scene_phase)
+    clocks["tension"] = 1 if threshold is not None and severity >= threshold else 0
 
-    if "reinforcements" in entry.tags or "visibility" in entry.tags:
+    if entry.tag_mask & _HEAT_TAGS_MASK:
         clocks["heat"] = 1 if severity >= 4 else 0
 
     recent_add = [entry.event_id]
@@ -64,22 +97,63 @@ def _derive_state_delta(scene: SceneContext, state: EngineState, entry: ContentE
     )
 
 
+# Cutoff resolution -> (prompt prefix, fallback prompt, fallback choices).
+# Resolutions not listed leave the fiction untouched.
+_CUTOFF_FICTION_OVERLAYS: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    "omen": (
+        "Omen: ",
+        "You notice signs of a larger threat gathering momentum.",
+        ("Investigate the sign", "Ignore it and press on"),
+    ),
+    "clock_tick": (
+        "Escalation: ",
+        "Pressure rises, something shifts in the background.",
+        ("Push to end this now", "Reposition and reduce exposure"),
+    ),
+    "downshift": (
+        "Narrow Escape: ",
+        "The worst of it doesn’t land, but you feel the near miss.",
+        ("Capitalize on the moment", "Recover and stabilize"),
+    ),
+}
+
+
 def _apply_cutoff_fiction_overlay(fiction: Fiction, resolution: str) -> Fiction:
-    if resolution == "none":
+    overlay = _CUTOFF_FICTION_OVERLAYS.get(resolution)
+    if overlay is None:
         return fiction
-    if resolution == "omen":
-        prompt = "Omen: " + (fiction.prompt or "You notice signs of a larger threat gathering momentum.")
-        choices = fiction.immediate_choice or ["Investigate the sign", "Ignore it and press on"]
-        return Fiction(prompt=prompt, sensory=fiction.sensory, immediate_choice=choices)
-    if resolution == "clock_tick":
-        prompt = "Escalation: " + (fiction.prompt or "Pressure rises, something shifts in the background.")
-        choices = fiction.immediate_choice or ["Push to end this now", "Reposition and reduce exposure"]
-        return Fiction(prompt=prompt, sensory=fiction.sensory, immediate_choice=choices)
-    if resolution == "downshift":
-        prompt = "Narrow Escape: " + (fiction.prompt or "The worst of it doesn’t land, but you feel the near miss.")
-        choices = fiction.immediate_choice or ["Capitalize on the moment", "Recover and stabilize"]
-        return Fiction(prompt=prompt, sensory=fiction.sensory, immediate_choice=choices)
-    return fiction
+    prefix, fallback_prompt, fallback_choices = overlay
+    return Fiction(
+        prompt=prefix + (fiction.prompt or fallback_prompt),
+        sensory=fiction.sensory,
+        immediate_choice=fiction.immediate_choice or list(fallback_choices),
+    )
+
+
+def prepare_selection(
+    scene: SceneContext,
+    selection: SelectionContext,
+    entries: Sequence[ContentEntry],
+) -> PreparedSelection:
+    """Precompute everything in `generate_event` that does not depend on EngineState.
+
+    Pass the result as `generate_event(..., prepared=...)` when generating
+    several events for the same scene and selection.
+    """
+    constraints = scene.constraints.clamped()
+    alpha = compute_alpha(selection.rarity_mode, constraints)
+    return PreparedSelection(
+        constraints=constraints,
+        alpha=alpha,
+        severity_weights=severity_weights(alpha, lo=1, hi=10),
+        entries=filter_static(
+            entries,
+            environment=scene.environment,
+            phase=scene.scene_phase,
+            include_tags=selection.include_tags,
+            exclude_tags=selection.exclude_tags,
+        ),
+    )
 
 
 def generate_event(
@@ -88,6 +162,8 @@ def generate_event(
     selection: SelectionContext,
     entries: Sequence[ContentEntry],
     rng: TraceRNG,
+    *,
+    prepared: Optional[PreparedSelection] = None,
 ) -> EngineEvent:
     """Generate one encounter complication event.
 
@@ -95,23 +171,24 @@ def generate_event(
     - system-agnostic outputs
     - deterministic with seed
     - severity never exceeds cap (cutoff converts)
+
+    `prepared` must come from `prepare_selection` for this same scene,
+    selection and entries; when given, `entries` is not re-filtered.
     """
-    constraints = scene.constraints.clamped()
+    if prepared is None:
+        prepared = prepare_selection(scene, selection, entries)
+    constraints = prepared.constraints
 
-    candidates = filter_entries(
-        entries=entries,
-        environment=scene.environment,
-        phase=scene.scene_phase,
-        include_tags=selection.include_tags,
-        exclude_tags=selection.exclude_tags,
+    candidates = filter_available(
+        prepared.entries,
         recent_event_ids=state.recent_event_ids,
         tag_cooldowns=state.tag_cooldowns,
     )
     if not candidates:
         raise ValueError("No content entries available after filtering/cooldowns. Broaden tags or add content.")
 
-    alpha = compute_alpha(selection.rarity_mode, constraints)
-    sampled = sample_severity(rng, alpha=alpha, lo=1, hi=10)
+    alpha = prepared.alpha
+    sampled = sample_severity(rng, alpha=alpha, lo=1, hi=10, weights=prepared.severity_weights)
 
     cap = compute_severity_cap(
         scene.party_band,
@@ -125,30 +202,7 @@ def generate_event(
     band_compatible = [e for e in candidates if e.severity_band[0] <= severity <= e.severity_band[1]]
     pool = band_compatible if band_compatible else candidates
 
-    # Adaptive weighting (v0.2): reduce "sticky" outcomes without hard-banning them.
-    recent = list(state.recent_event_ids or [])
-    recency_index = {eid: i for i, eid in enumerate(recent)}  # 0 = most recent
-    weights = []
-    for e in pool:
-        w = float(e.weight)
-        if e.event_id in recency_index:
-            i = recency_index[e.event_id]
-            # Tiered penalty based on recency position
-            # Stronger penalties for very recent, gentler for older
-            if i == 0:
-                penalty = 10.0  # just occurred
-            elif i == 1:
-                penalty = 6.0
-            elif i == 2:
-                penalty = 4.0
-            elif i <= 4:
-                penalty = 3.0
-            elif i <= 6:
-                penalty = 2.0
-            else:
-                penalty = 1.5  # old but still in window
-            w = w / penalty
-        weights.append(w)
+    weights = _adaptive_weights(pool, state.recent_event_ids)
 
     entry = rng.weighted_choice(pool, weights, label="content_entry")
 
@@ -180,5 +234,35 @@ def generate_event(
         fiction=fiction,
         state_delta=delta,
         followups=followups,
-        rng_trace=list(rng.trace),
+        rng_trace=list(rng.trace) if rng.trace_enabled else [],
     )
+
+
+def generate_events(
+    scene: SceneContext,
+    state: EngineState,
+    selection: SelectionContext,
+    entries: Sequence[ContentEntry],
+    rng: TraceRNG,
+    count: int,
+    *,
+    advance_state: bool = True,
+) -> Tuple[List[EngineEvent], EngineState]:
+    """Generate `count` events for one scene and selection.
+
+    Selection setup runs once for the whole batch. Each event's rng_trace
+    covers only that event. With `advance_state`, each event's state delta is
+    applied before the next event is generated (same as calling
+    generate_event + apply_state_delta in a loop).
+
+    Returns (events, resulting_state).
+    """
+    prepared = prepare_selection(scene, selection, entries)
+    events: List[EngineEvent] = []
+    for _ in range(int(count)):
+        rng.reset_trace()
+        event = generate_event(scene, state, selection, entries, rng, prepared=prepared)
+        if advance_state:
+            state = apply_state_delta(state, event.state_delta)
+        events.append(event)
+    return events, state
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Literal, Optional, Tuple
+import sys
+import threading
+from dataclasses import dataclass, field, fields
+from typing import Dict, Iterable, List, Literal, Optional, Tuple
 
 ScenePhase = Literal["approach", "engage", "aftermath"]
 RarityMode = Literal["calm", "normal", "spiky"]
@@ -9,7 +11,11 @@ PartyBand = Literal["low", "mid", "high", "unknown"]
 
 CutoffResolution = Literal["none", "omen", "hook", "clock_tick", "downshift", "reroll"]
 
-@dataclass(frozen=True)
+# Engine records are built per event; on Python 3.10+ they drop the
+# per-instance __dict__ (dataclass slots=True is unavailable on 3.9).
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_SLOTS)
 class Constraints:
     confinement: float
     connectivity: float
@@ -20,17 +26,29 @@ class Constraints:
             return max(0.0, min(1.0, x))
         return Constraints(c(self.confinement), c(self.connectivity), c(self.visibility))
 
-@dataclass(frozen=True)
+def _freeze_fields(obj: object, names: Tuple[str, ...]) -> None:
+    """Coerce the named sequence fields of a frozen dataclass to tuples."""
+    for name in names:
+        value = getattr(obj, name)
+        if not isinstance(value, tuple):
+            object.__setattr__(obj, name, tuple(value or ()))
+
+@dataclass(frozen=True, **_SLOTS)
 class SceneContext:
+    """Scene inputs. Sequence fields are stored as tuples (lists are accepted
+    and converted), so contexts are hashable and usable as cache keys."""
     scene_id: str
     scene_phase: ScenePhase
-    environment: List[str]
-    tone: List[str]
+    environment: Tuple[str, ...]
+    tone: Tuple[str, ...]
     constraints: Constraints
     party_band: PartyBand = "unknown"
-    spotlight: List[str] = field(default_factory=list)
+    spotlight: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        _freeze_fields(self, ("environment", "tone", "spotlight"))
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class EngineState:
     clocks: Dict[str, int] = field(default_factory=dict)
     recent_event_ids: List[str] = field(default_factory=list)
@@ -46,15 +64,19 @@ class EngineState:
             flags={"alarm_raised": False, "reinforcements_possible": True, "exit_available": True},
         )
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class SelectionContext:
-    enabled_packs: List[str]
-    include_tags: List[str]
-    exclude_tags: List[str]
-    factions_present: List[str]
+    """Content selection inputs; hashable like SceneContext."""
+    enabled_packs: Tuple[str, ...]
+    include_tags: Tuple[str, ...]
+    exclude_tags: Tuple[str, ...]
+    factions_present: Tuple[str, ...]
     rarity_mode: RarityMode = "normal"
 
-@dataclass(frozen=True)
+    def __post_init__(self) -> None:
+        _freeze_fields(self, ("enabled_packs", "include_tags", "exclude_tags", "factions_present"))
+
+@dataclass(frozen=True, **_SLOTS)
 class EffectVector:
     threat: int = 0
     cost: int = 0
@@ -64,26 +86,59 @@ class EffectVector:
     information: int = 0
     opportunity: int = 0
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Fiction:
     prompt: str
     sensory: List[str] = field(default_factory=list)
     immediate_choice: List[str] = field(default_factory=list)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class StateDelta:
     clocks: Dict[str, int] = field(default_factory=dict)
     recent_event_ids_add: List[str] = field(default_factory=list)
     tag_cooldowns_set: Dict[str, int] = field(default_factory=dict)
     flags_set: Dict[str, bool] = field(default_factory=dict)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class AdapterHints:
     difficulty_hint: Optional[Literal["easy", "standard", "hard"]] = None
     scale_hint: Optional[Literal["single", "area", "scene"]] = None
     duration_hint: Optional[Literal["instant", "short", "scene"]] = None
 
-@dataclass(frozen=True)
+# Process-wide tag -> bit registry. Bits are assigned in first-seen order, so
+# masks are only meaningful within one process (never persist them). Only
+# content entries and engine constants register tags; query-side masks built
+# from user input (include/exclude tags, cooldowns) use register=False, so the
+# registry stays bounded by the tag vocabulary of the packs loaded so far.
+# Lookups are lock-free; registering a new tag takes _TAG_BITS_LOCK so threads
+# (e.g. concurrent Streamlit sessions loading packs) never share a bit.
+_TAG_BITS: Dict[str, int] = {}
+_TAG_BITS_LOCK = threading.Lock()
+
+def _register_tag(tag: str) -> int:
+    with _TAG_BITS_LOCK:
+        bit = _TAG_BITS.get(tag)
+        if bit is None:
+            bit = _TAG_BITS[tag] = 1 << len(_TAG_BITS)
+        return bit
+
+def tags_to_mask(tags: Iterable[str], *, register: bool = True) -> int:
+    """Return an int bitmask with one bit set per tag.
+
+    With register=False, tags that have no bit yet contribute nothing: no
+    loaded entry carries them, so they can neither match nor exclude one.
+    """
+    m = 0
+    for t in tags:
+        bit = _TAG_BITS.get(t)
+        if bit is None:
+            if not register:
+                continue
+            bit = _register_tag(t)
+        m |= bit
+    return m
+
+@dataclass(frozen=True, **_SLOTS)
 class ContentEntry:
     event_id: str
     title: str
@@ -99,8 +154,22 @@ class ContentEntry:
     fiction_sensory: List[str] = field(default_factory=list)
     fiction_choices: List[str] = field(default_factory=list)
     adapter_hints: Optional[AdapterHints] = None
+    # Derived from `tags` for fast include/exclude filtering.
+    tag_mask: int = field(init=False, repr=False, compare=False, default=0)
+
+    def __post_init__(self) -> None:
+        # Interned so recency/cooldown lookups on event ids compare by identity
+        object.__setattr__(self, "event_id", sys.intern(self.event_id))
+        object.__setattr__(self, "tag_mask", tags_to_mask(self.tags))
 
-@dataclass(frozen=True)
+    def __reduce__(self) -> tuple:
+        # Pickle as a constructor call on the init fields, so unpickling runs
+        # __post_init__: tag_mask bits are process-local and must be rebuilt.
+        # (On 3.10, slotted frozen dataclasses replace any __getstate__ /
+        # __setstate__ defined here, so those hooks cannot be relied on.)
+        return (type(self), tuple(getattr(self, f.name) for f in fields(self) if f.init))
+
+@dataclass(frozen=True, **_SLOTS)
 class EngineEvent:
     event_id: str
     title: str
@@ -114,3 +183,14 @@ class EngineEvent:
     state_delta: StateDelta
     followups: List[Dict[str, str]] = field(default_factory=list)
     rng_trace: List[Dict[str, str]] = field(default_factory=list)
+
+@dataclass(frozen=True, **_SLOTS)
+class PreparedSelection:
+    """Scene/selection-derived values that stay fixed across a run of events.
+
+    Built by `spar_engine.engine.prepare_selection`; never depends on EngineState.
+    """
+    constraints: Constraints  # clamped
+    alpha: float
+    severity_weights: Tuple[float, ...]  # Zipf weights for severities 1..10 at alpha
+    entries: List[ContentEntry]  # filtered on environment, phase and tags
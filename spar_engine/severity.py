@@ -1,9 +1,24 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Sequence
+
 from .models import Constraints, EngineState, PartyBand, RarityMode, ScenePhase
 from .rng import TraceRNG
 
 
+# Lookup tables are module constants so the per-event calls below do not
+# rebuild them.
+_ALPHA_BASE = {"calm": 2.2, "normal": 1.6, "spiky": 1.2}
+
+_CAP_BASE_BY_BAND = {
+    "low": {"approach": 6, "engage": 7, "aftermath": 6},
+    "mid": {"approach": 7, "engage": 8, "aftermath": 7},
+    "high": {"approach": 8, "engage": 9, "aftermath": 8},
+    "unknown": {"approach": 7, "engage": 8, "aftermath": 7},
+}
+
+
 def _clamp(x: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, x))
 
@@ -19,7 +34,7 @@ def compute_alpha(rarity_mode: RarityMode, constraints: Constraints) -> float:
     - morphology-like constraints (confinement, connectivity, visibility)
     """
     c = constraints.clamped()
-    base = {"calm": 2.2, "normal": 1.6, "spiky": 1.2}[rarity_mode]
+    base = _ALPHA_BASE[rarity_mode]
     morph = (c.confinement + c.visibility - c.connectivity)  # [-1, 2]
     alpha = base - 0.35 * morph
     return _clamp(alpha, 0.8, 3.0)
@@ -41,18 +56,7 @@ def compute_severity_cap(
     - spiky: lower cap a bit (more conversions), especially in high-morphology scenes
     - calm: raise cap a bit (fewer conversions)
     """
-    base_by_band = {
-        "low": {"approach": 6, "engage": 7, "aftermath": 6},
-        "mid": {"approach": 7, "engage": 8, "aftermath": 7},
-        "high": {"approach": 8, "engage": 9, "aftermath": 8},
-        "unknown": {"approach": 7, "engage": 8, "aftermath": 7},
-    }
-    base = int(base_by_band[party_band][phase])
-
-    c = constraints.clamped()
-    morph = (c.confinement + c.visibility - c.connectivity)  # [-1, 2]
-    adj = round(_clamp(morph, -1.0, 2.0) * 0.75)
-    cap = base + adj
+    cap = _scene_severity_cap(party_band, phase, constraints, rarity_mode)
 
     tension = int(state.clocks.get("tension", 0))
     heat = int(state.clocks.get("heat", 0))
@@ -61,6 +65,29 @@ def compute_severity_cap(
     if heat >= 9:
         cap += 1
 
+    return int(_clamp(cap, 3, 10))
+
+
+@lru_cache(maxsize=256)
+def _scene_severity_cap(
+    party_band: PartyBand,
+    phase: ScenePhase,
+    constraints: Constraints,
+    rarity_mode: RarityMode,
+) -> int:
+    """The unclamped part of compute_severity_cap that ignores EngineState.
+
+    Every adjustment before the final clamp is additive, so the clock
+    bonuses can be added afterwards; cached because a scene's inputs repeat
+    for every event generated in it.
+    """
+    base = int(_CAP_BASE_BY_BAND[party_band][phase])
+
+    c = constraints.clamped()
+    morph = (c.confinement + c.visibility - c.connectivity)  # [-1, 2]
+    adj = round(_clamp(morph, -1.0, 2.0) * 0.75)
+    cap = base + adj
+
     if rarity_mode == "spiky":
         if morph >= 0.9:
             cap -= 1
@@ -69,11 +96,29 @@ def compute_severity_cap(
     elif rarity_mode == "calm":
         cap += 1
 
-    return int(_clamp(cap, 3, 10))
+    return cap
+
 
+def severity_weights(alpha: float, lo: int = 1, hi: int = 10) -> tuple[float, ...]:
+    """Zipf-like weights 1/s**alpha for severities lo..hi."""
+    return tuple(1.0 / (s ** alpha) for s in range(lo, hi + 1))
 
-def sample_severity(rng: TraceRNG, alpha: float, lo: int = 1, hi: int = 10) -> int:
-    severities = list(range(lo, hi + 1))
-    weights = [1.0 / (s ** alpha) for s in severities]
+
+def sample_severity(
+    rng: TraceRNG,
+    alpha: float,
+    lo: int = 1,
+    hi: int = 10,
+    *,
+    weights: Sequence[float] | None = None,
+) -> int:
+    """Sample a severity in [lo, hi].
+
+    `weights` may be passed from `severity_weights(alpha, lo, hi)` when alpha is
+    fixed across many samples; it must match alpha, lo and hi.
+    """
+    severities = range(lo, hi + 1)
+    if weights is None:
+        weights = severity_weights(alpha, lo, hi)
     s = rng.weighted_choice(severities, weights, label=f"severity(zipf,alpha={alpha:.2f})")
     return int(s)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from itertools import chain
 from typing import Dict, List
 
 from .models import EngineState, StateDelta
@@ -20,30 +21,34 @@ def apply_state_delta(
     - recent_event_ids: prepend new IDs, de-dupe, cap length
     - tag_cooldowns_set: set cooldowns to max(existing, set_value)
     - flags_set: overwrite keys provided
+
+    Containers the delta does not touch are shared with `state`, not copied;
+    states are treated as immutable values, so callers must never mutate them.
     """
-    clocks: Dict[str, int] = dict(state.clocks)
-    for k, v in (delta.clocks or {}).items():
-        clocks[k] = int(clocks.get(k, 0) + int(v))
-        clocks[k] = max(int(clock_min), min(int(clock_max), int(clocks[k])))
-
-    combined = list(delta.recent_event_ids_add or []) + list(state.recent_event_ids or [])
-    seen = set()
-    recent: List[str] = []
-    for eid in combined:
-        if eid in seen:
-            continue
-        seen.add(eid)
-        recent.append(eid)
-        if len(recent) >= int(recent_max_len):
-            break
-
-    tag_cooldowns = dict(state.tag_cooldowns)
-    for tag, cd in (delta.tag_cooldowns_set or {}).items():
-        tag_cooldowns[tag] = max(int(tag_cooldowns.get(tag, 0)), int(cd))
-
-    flags = dict(state.flags)
-    for k, v in (delta.flags_set or {}).items():
-        flags[k] = bool(v)
+    clocks: Dict[str, int] = state.clocks
+    if delta.clocks:
+        clocks = dict(clocks)
+        lo, hi = int(clock_min), int(clock_max)
+        for k, v in delta.clocks.items():
+            n = int(clocks.get(k, 0) + int(v))
+            clocks[k] = lo if n < lo else hi if n > hi else n
+
+    # dict.fromkeys keeps the first occurrence of each id, newest first
+    recent: List[str] = list(
+        dict.fromkeys(chain(delta.recent_event_ids_add or (), state.recent_event_ids or ()))
+    )[: int(recent_max_len)]
+
+    tag_cooldowns = state.tag_cooldowns
+    if delta.tag_cooldowns_set:
+        tag_cooldowns = dict(tag_cooldowns)
+        for tag, cd in delta.tag_cooldowns_set.items():
+            tag_cooldowns[tag] = max(int(tag_cooldowns.get(tag, 0)), int(cd))
+
+    flags = state.flags
+    if delta.flags_set:
+        flags = dict(flags)
+        for k, v in delta.flags_set.items():
+            flags[k] = bool(v)
 
     return EngineState(
         clocks=clocks,
@@ -61,6 +66,8 @@ def tick_state(state: EngineState, ticks: int = 1) -> EngineState:
     - age `recent_event_ids` by dropping oldest entries at a rate of 1 per 2 ticks
       (slower aging preserves adaptive weighting effectiveness)
     - clocks are NOT automatically decremented
+
+    clocks and flags are shared with `state` (see apply_state_delta).
     """
     t = max(0, int(ticks))
     if t == 0:
@@ -74,13 +81,12 @@ def tick_state(state: EngineState, ticks: int = 1) -> EngineState:
 
     recent = list(state.recent_event_ids or [])
     # Age recent_event_ids by dropping the oldest entries at a rate of 1 per tick
-    drop = min(t, len(recent))
-    if drop:
-        recent = recent[:-drop]
+    # (trimmed in place on the fresh copy rather than sliced into another list)
+    del recent[max(0, len(recent) - t):]
 
     return EngineState(
-        clocks=dict(state.clocks),
+        clocks=state.clocks,
         recent_event_ids=recent,
         tag_cooldowns=tag_cooldowns,
-        flags=dict(state.flags),
+        flags=state.flags,
     )
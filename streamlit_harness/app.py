@@ -8,6 +8,7 @@ if str(_REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT))
 
 from collections import Counter
+from dataclasses import asdict
 import json
 from pathlib import Path
 from typing import Any, Dict, List
@@ -17,7 +18,7 @@ import time
 import streamlit as st
 
 from spar_engine.content import load_pack
-from spar_engine.engine import generate_event
+from spar_engine.engine import generate_event, prepare_selection
 from spar_engine.models import Constraints, SceneContext, SelectionContext
 from spar_engine.rng import TraceRNG
 from spar_engine.state import apply_state_delta, tick_state
@@ -212,11 +213,7 @@ def derive_tag_vocab(entries) -> List[str]:
 
 
 def event_to_dict(ev) -> Dict[str, Any]:
-    d = ev.__dict__.copy()
-    d["effect_vector"] = ev.effect_vector.__dict__
-    d["fiction"] = ev.fiction.__dict__
-    d["state_delta"] = ev.state_delta.__dict__
-    return d
+    return asdict(ev)
 
 
 def summarize_events(events: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -310,6 +307,7 @@ def run_batch(
 ) -> Dict[str, Any]:
     state = starting_engine_state
     rng = TraceRNG(seed=int(seed))
+    prepared = prepare_selection(scene, selection, entries)
     events: List[Dict[str, Any]] = []
 
     for idx in range(int(n)):
@@ -319,8 +317,8 @@ def run_batch(
             tick_amount = max(1, int(ticks_between) if tick_between else 1)
             state = tick_state(state, ticks=tick_amount)
 
-        rng.trace.clear()
-        ev = generate_event(scene, state, selection, entries, rng)
+        rng.reset_trace()
+        ev = generate_event(scene, state, selection, entries, rng, prepared=prepared)
         state = apply_state_delta(state, ev.state_delta)
         events.append(event_to_dict(ev))
 
@@ -328,7 +326,7 @@ def run_batch(
     return {
         "seed": int(seed),
         "n": int(n),
-        "final_state": state.__dict__,
+        "final_state": asdict(state),
         "summary": summary,
         "events": events if verbose else None,
         "events_sample": None if verbose else events[:10],
@@ -567,7 +565,7 @@ def run_campaign_scenario(
         "ticks_between": scenario.get("ticks_between", 1),
         "verbose": scenario.get("verbose", False),
         "scenes": [],  # Per-scene results in order
-        "initial_state": engine_state_class.default().__dict__,  # For reference
+        "initial_state": asdict(engine_state_class.default()),  # For reference
     }
     
     # Execute scenes sequentially
@@ -645,7 +643,7 @@ def run_campaign_scenario(
         })
     
     # Add final state to report
-    report["final_state"] = shared_state.__dict__
+    report["final_state"] = asdict(shared_state)
     
     return report
 
@@ -762,7 +760,7 @@ def main() -> None:
 
         st.text_area(
             "Current state (read-only)",
-            value=json.dumps(hs.engine_state.__dict__, indent=2),
+            value=json.dumps(asdict(hs.engine_state), indent=2),
             height=180,
         )
 
@@ -822,14 +820,15 @@ def main() -> None:
                     hs.engine_state = tick_state(hs.engine_state, ticks=int(ticks))
 
                 rng = TraceRNG(seed=int(seed))
+                prepared = prepare_selection(scene, selection, entries)
 
                 batch_events: List[Dict[str, Any]] = []
                 for idx in range(n):
                     if idx > 0 and tick_between and int(ticks_between_events) > 0:
                         hs.engine_state = tick_state(hs.engine_state, ticks=int(ticks_between_events))
 
-                    rng.trace.clear()
-                    ev = generate_event(scene, hs.engine_state, selection, entries, rng)
+                    rng.reset_trace()
+                    ev = generate_event(scene, hs.engine_state, selection, entries, rng, prepared=prepared)
                     hs.engine_state = apply_state_delta(hs.engine_state, ev.state_delta)
 
                     d = event_to_dict(ev)
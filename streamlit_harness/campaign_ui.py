@@ -21,11 +21,27 @@ import streamlit as st
 from spar_campaign import CampaignState, Scar, FactionState
 from streamlit_harness.import_overrides import ImportOverrides
 
+try:  # Optional speedup: orjson is a C JSON codec; stdlib json is the fallback.
+    import orjson
+except ImportError:  # pragma: no cover - exercised only when orjson is absent
+    orjson = None
+
 
 CAMPAIGNS_DIR = Path("campaigns")
 CAMPAIGNS_DIR.mkdir(exist_ok=True)
 
 
+def _read_json(path: Path) -> Any:
+    """Decode a campaign JSON file (orjson when available).
+
+    Campaign files are always UTF-8 (orjson writes raw UTF-8 bytes), so the
+    stdlib path must not fall back to the locale encoding.
+    """
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
 def normalize_campaign_name_to_dir(name: str) -> str:
     """Normalize campaign name to valid directory name.
     
@@ -130,7 +146,11 @@ class Campaign:
         """Save campaign to disk in subdirectory."""
         path = self.get_path()
         path.parent.mkdir(parents=True, exist_ok=True)  # Ensure subdirectory exists
-        path.write_text(json.dumps(self.to_dict(), indent=2))
+        if orjson is not None:
+            # Same indent-2 layout; non-string keys are stringified like json.dumps
+            path.write_bytes(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
     
     @staticmethod
     def load(campaign_id: str) -> Optional["Campaign"]:
@@ -141,7 +161,7 @@ class Campaign:
                 path = subdir / f"{campaign_id}.json"
                 if path.exists():
                     try:
-                        data = json.loads(path.read_text())
+                        data = _read_json(path)
                         return Campaign.from_dict(data)
                     except Exception:
                         continue
@@ -159,7 +179,7 @@ class Campaign:
                     if "_import_overrides" in json_file.name:
                         continue
                     try:
-                        data = json.loads(json_file.read_text())
+                        data = _read_json(json_file)
                         campaigns.append(Campaign.from_dict(data))
                     except Exception:
                         continue
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_pack_cache(tmp_path_factory, monkeypatch):
+    """Keep load_pack_cached (including CLI subprocesses) out of the user's cache dir."""
+    monkeypatch.setenv("SPAR_CACHE_DIR", str(tmp_path_factory.mktemp("pack_cache")))
@@ -0,0 +1,95 @@
+from spar_campaign import CampaignDelta, CampaignState, Scar, apply_campaign_delta, get_campaign_influence
+
+
+def _scar(scar_id, category):
+    return Scar(scar_id=scar_id, category=category, severity="medium")
+
+
+def test_campaign_state_freezes_scars_to_tuple():
+    s = CampaignState(scars=[_scar("a", "resource")])
+    assert s.scars == (_scar("a", "resource"),)
+    assert CampaignState.from_dict(s.to_dict()).scars == s.scars
+
+
+def test_apply_campaign_delta_skips_known_scar_ids():
+    s = CampaignState(scars=[_scar("a", "resource")])
+    d = CampaignDelta(scars_add=[_scar("a", "social"), _scar("b", "social")])
+    s2 = apply_campaign_delta(s, d)
+    assert [x.scar_id for x in s2.scars] == ["a", "b"]
+    assert s2.scars[0].category == "resource"
+
+
+def test_scar_influence_keeps_scar_order():
+    s = CampaignState(scars=[_scar("rep", "reputation"), _scar("sup", "resource")])
+    influence = get_campaign_influence(s)
+    scar_notes = [n for n in influence["notes"] if n.startswith("Scar:")]
+    assert scar_notes == [
+        "Scar: rep - social complications likely",
+        "Scar: sup - supply pressure continues",
+    ]
+    assert "attrition" in influence["include_tags"]
+    assert "social_friction" in influence["include_tags"]
+
+
+def test_influence_tags_are_unique():
+    s = CampaignState(
+        campaign_pressure=20,
+        heat=15,
+        scars=[_scar("rep", "reputation"), _scar("pol", "political")],
+    )
+    tags = get_campaign_influence(s)["include_tags"]
+    assert tags == ["time_pressure", "reinforcements", "social_friction", "visibility"]
+
+
+def test_influence_quiet_mode_skips_notes_only():
+    s = CampaignState(campaign_pressure=12, heat=9, scars=[_scar("sup", "resource")])
+    full = get_campaign_influence(s)
+    quiet = get_campaign_influence(s, verbose=False)
+    assert full["notes"] and quiet["notes"] == []
+    assert {k: v for k, v in quiet.items() if k != "notes"} == {k: v for k, v in full.items() if k != "notes"}
+
+
+def test_apply_campaign_delta_without_scars_shares_tuple():
+    s = CampaignState(scars=[_scar("a", "resource")])
+    assert apply_campaign_delta(s, CampaignDelta(heat_add=1)).scars is s.scars
+    d = CampaignDelta(scars_add=[_scar("b", "social"), _scar("b", "resource")])
+    assert [x.category for x in apply_campaign_delta(s, d).scars] == ["resource", "social"]
+
+
+def test_apply_campaign_delta_shares_unchanged_factions():
+    s = apply_campaign_delta(CampaignState(), CampaignDelta(faction_updates={"watch": {"attention_add": 20}}))
+    assert s.factions["watch"].attention == 20
+    # Capped attention: no effective change, so the mapping is reused
+    s2 = apply_campaign_delta(s, CampaignDelta(faction_updates={"watch": {"attention_add": 1}}))
+    assert s2.factions is s.factions
+    s3 = apply_campaign_delta(s, CampaignDelta(faction_updates={"guild": {"attention_add": 1}}))
+    assert set(s3.factions) == {"watch", "guild"} and set(s.factions) == {"watch"}
+
+
+def test_campaign_state_round_trips_through_pickle():
+    import pickle
+
+    s = apply_campaign_delta(
+        CampaignState(scars=[_scar("a", "resource")]),
+        CampaignDelta(faction_updates={"watch": {"attention_add": 2}}),
+    )
+    assert pickle.loads(pickle.dumps(s)) == s
+
+
+def test_influence_results_are_independent_copies():
+    s = CampaignState(campaign_pressure=12)
+    first = get_campaign_influence(s)
+    first["include_tags"].append("mutated")
+    first["notes"].clear()
+    second = get_campaign_influence(s)
+    assert second["include_tags"] == ["time_pressure"]
+    assert second["notes"]
+
+
+def test_from_dict_upgrades_v0_1_string_scars():
+    s = CampaignState.from_dict({"version": "0.1", "campaign_pressure": 4, "scars": ["resources_depleted"]})
+    assert s.version == "0.2" and s.scars == () and s._legacy_scars == {"resources_depleted"}
+    assert s.campaign_pressure == 4
+    # Unlabelled string scars are treated as v0.1 as well
+    assert CampaignState.from_dict({"version": "0.2", "scars": ["x"]})._legacy_scars == {"x"}
+    assert "attrition" in get_campaign_influence(s)["include_tags"]
@@ -31,3 +31,35 @@ def test_cli_event_alias_and_preset():
     assert len(out) == 1
     obj = json.loads(out[0])
     assert obj["event_id"] == "hazard_smoke_01"
+
+def test_cli_state_out_round_trips(tmp_path):
+    repo = Path(__file__).resolve().parents[1]
+    state_path = tmp_path / "state.json"
+    base = [sys.executable, str(repo / "engine.py"), "--format", "jsonl", "--seed", "3"]
+    subprocess.check_output(base + ["--state-out", str(state_path)], cwd=str(repo), text=True)
+    first = json.loads(state_path.read_text())
+    assert len(first["recent_event_ids"]) == 1
+
+    subprocess.check_output(
+        base + ["--state-in", str(state_path), "--state-out", str(state_path)],
+        cwd=str(repo), text=True,
+    )
+    second = json.loads(state_path.read_text())
+    assert len(second["recent_event_ids"]) == 2
+    assert second["recent_event_ids"][1] == first["recent_event_ids"][0]
+
+
+def test_cli_keeps_events_written_before_a_failure():
+    repo = Path(__file__).resolve().parents[1]
+    cmd = [
+        sys.executable,
+        str(repo / "engine.py"),
+        "--event", "hazard_smoke_01",
+        "--count", "4",
+        "--format", "jsonl",
+        "--seed", "2",
+    ]
+    # The forced event goes on cooldown after the first roll
+    proc = subprocess.run(cmd, cwd=str(repo), capture_output=True, text=True)
+    assert proc.returncode != 0
+    assert [json.loads(l)["event_id"] for l in proc.stdout.strip().splitlines()] == ["hazard_smoke_01"]
@@ -26,3 +26,113 @@ def test_recent_event_id_blocks_repeat():
         tag_cooldowns={},
     )
     assert all(e.event_id != some for e in out)
+
+def test_load_pack_cached_writes_cache_and_rebuilds_when_pack_changes(tmp_path):
+    import json
+    import sys
+    from spar_engine.content import load_pack_cached
+
+    raw = json.loads(open("data/core_complications.json").read())
+    pack = tmp_path / "pack.json"
+    pack.write_text(json.dumps(raw[:3]))
+    cache_dir = tmp_path / "cache"
+
+    first = load_pack_cached(pack, cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+    assert not list(tmp_path.glob("*.pkl"))  # nothing written next to the pack
+    cached = load_pack_cached(pack, cache_dir=cache_dir)
+    assert cached == first
+    assert all(e.event_id is sys.intern(e.event_id) for e in cached)
+
+    pack.write_text(json.dumps(raw[:2]))
+    assert [e.event_id for e in load_pack_cached(pack, cache_dir=cache_dir)] == [r["event_id"] for r in raw[:2]]
+
+def test_include_tags_match_any_and_unknown_tags_match_nothing():
+    entries = load_pack("data/core_complications.json")
+    common = dict(environment=["dungeon"], phase="engage", exclude_tags=[], recent_event_ids=[], tag_cooldowns={})
+    out = filter_entries(entries=entries, include_tags=["hazard", "mystic"], **common)
+    assert out and all({"hazard", "mystic"} & set(e.tags) for e in out)
+    assert filter_entries(entries=entries, include_tags=["no_such_tag"], **common) == []
+
+def test_tag_cooldowns_block_only_active_tags():
+    entries = load_pack("data/core_complications.json")
+    common = dict(environment=["dungeon"], phase="engage", include_tags=["hazard", "visibility"], exclude_tags=[], recent_event_ids=[])
+    out = filter_entries(entries=entries, tag_cooldowns={"hazard": 2, "visibility": 0}, **common)
+    assert out and all("hazard" not in e.tags for e in out)
+    assert any("visibility" in e.tags for e in out)
+
+def test_load_pack_cached_recovers_from_truncated_cache(tmp_path):
+    from spar_engine.content import load_pack_cached
+
+    cache_dir = tmp_path / "cache"
+    expected = load_pack_cached("data/core_complications.json", cache_dir=cache_dir)
+    (cached_file,) = cache_dir.glob("*.pkl")
+    cached_file.write_bytes(cached_file.read_bytes()[:40])
+
+    assert load_pack_cached("data/core_complications.json", cache_dir=cache_dir) == expected
+    assert load_pack_cached("data/core_complications.json", cache_dir=cache_dir) == expected  # rewritten whole
+    assert [p.name for p in cache_dir.iterdir() if p.suffix == ".tmp"] == []
+
+def test_query_tags_do_not_grow_tag_registry():
+    from spar_engine.models import _TAG_BITS
+
+    entries = load_pack("data/core_complications.json")
+    known = len(_TAG_BITS)
+    common = dict(environment=["dungeon"], phase="engage", recent_event_ids=[])
+    out = filter_entries(
+        entries=entries,
+        include_tags=["hazard", "user_typed_tag"],
+        exclude_tags=["another_unknown"],
+        tag_cooldowns={"cooldown_only_tag": 3},
+        **common,
+    )
+    assert out and all("hazard" in e.tags for e in out)
+    assert len(_TAG_BITS) == known
+
+def test_load_pack_cached_rebuilds_tag_masks_in_a_new_process(tmp_path):
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    repo = Path(__file__).resolve().parents[1]
+    pack = repo / "data" / "core_complications.json"
+    count_hazard = (
+        "from spar_engine.content import filter_entries, load_pack_cached\n"
+        "out = filter_entries(entries=load_pack_cached({pack!r}), environment=['dungeon'], phase='engage',\n"
+        "                     include_tags=['hazard'], exclude_tags=[], recent_event_ids=[], tag_cooldowns={{}})\n"
+        "print(len(out))\n"
+    ).format(pack=str(pack))
+    # The writer registers unrelated tags first, so its tag bits differ from the reader's
+    writer = "from spar_engine.models import tags_to_mask\ntags_to_mask(['zz_a', 'zz_b', 'zz_c'])\n" + count_hazard
+
+    def run(code):
+        return int(subprocess.check_output([sys.executable, "-c", code], cwd=str(repo), text=True))
+
+    expected = len(filter_entries(
+        entries=load_pack(pack), environment=["dungeon"], phase="engage",
+        include_tags=["hazard"], exclude_tags=[], recent_event_ids=[], tag_cooldowns={},
+    ))
+    assert expected > 0
+    # Both subprocesses share the SPAR_CACHE_DIR set by conftest
+    assert run(writer) == expected
+    assert run(count_hazard) == expected
+
+def test_concurrent_tag_registration_assigns_distinct_bits():
+    import threading
+    from spar_engine.models import _TAG_BITS, tags_to_mask
+
+    names = [[f"thread{i}_tag{j}" for j in range(50)] for i in range(8)]
+    start = threading.Barrier(len(names))
+
+    def register(tags):
+        start.wait()
+        for t in tags:
+            tags_to_mask([t])
+
+    threads = [threading.Thread(target=register, args=(tags,)) for tags in names]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    bits = [_TAG_BITS[t] for tags in names for t in tags]
+    assert len(set(bits)) == len(bits)
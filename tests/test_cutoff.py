@@ -13,3 +13,17 @@ def test_cutoff_noop_when_under_cap():
     assert applied is False
     assert res == "none"
     assert orig is None
+
+def test_cutoff_fiction_overlay_prefixes_and_fallbacks():
+    from spar_engine.engine import _apply_cutoff_fiction_overlay
+    from spar_engine.models import Fiction
+
+    blank = Fiction(prompt="")
+    omen = _apply_cutoff_fiction_overlay(blank, "omen")
+    assert omen.prompt.startswith("Omen: You notice")
+    assert omen.immediate_choice == ["Investigate the sign", "Ignore it and press on"]
+
+    given = Fiction(prompt="Smoke.", immediate_choice=["Run"])
+    assert _apply_cutoff_fiction_overlay(given, "downshift").prompt == "Narrow Escape: Smoke."
+    assert _apply_cutoff_fiction_overlay(given, "clock_tick").immediate_choice == ["Run"]
+    assert _apply_cutoff_fiction_overlay(given, "hook") is given
@@ -39,3 +39,91 @@ def test_gist_generate_events_deterministic_and_safe():
 
     # outputs should be populated
     assert all(e.event_id and e.title and isinstance(e.tags, list) for e in events)
+
+
+def test_prepared_selection_matches_unprepared():
+    from spar_engine.engine import prepare_selection
+    from spar_engine.state import apply_state_delta, tick_state
+
+    entries = load_pack("data/core_complications.json")
+    scene = SceneContext(
+        scene_id="prep",
+        scene_phase="engage",
+        environment=["city"],
+        tone=["gritty"],
+        constraints=Constraints(confinement=0.4, connectivity=0.8, visibility=0.7),
+        party_band="mid",
+    )
+    sel = SelectionContext(
+        enabled_packs=["core_complications_v0_1"],
+        include_tags=["hazard","reinforcements","time_pressure","social_friction","visibility"],
+        exclude_tags=[],
+        factions_present=[],
+        rarity_mode="spiky",
+    )
+    prepared = prepare_selection(scene, sel, entries)
+
+    def run(**kw):
+        rng, state, out = TraceRNG(seed=5), EngineState.default(), []
+        for _ in range(12):
+            ev = generate_event(scene, state, sel, entries, rng, **kw)
+            state = tick_state(apply_state_delta(state, ev.state_delta), ticks=1)
+            out.append(ev)
+        return out
+
+    assert run() == run(prepared=prepared)
+
+
+def test_generate_events_matches_event_loop():
+    from spar_engine.engine import generate_events
+    from spar_engine.state import apply_state_delta
+
+    entries = load_pack("data/core_complications.json")
+    scene = SceneContext(
+        scene_id="batch",
+        scene_phase="approach",
+        environment=["dungeon"],
+        tone=["gritty"],
+        constraints=Constraints(confinement=0.8, connectivity=0.2, visibility=0.7),
+    )
+    sel = SelectionContext(
+        enabled_packs=["core_complications_v0_1"],
+        include_tags=["hazard","reinforcements","time_pressure","social_friction","visibility","mystic"],
+        exclude_tags=[],
+        factions_present=[],
+    )
+
+    rng, state, expected = TraceRNG(seed=11), EngineState.default(), []
+    for _ in range(4):
+        rng.trace.clear()
+        ev = generate_event(scene, state, sel, entries, rng)
+        state = apply_state_delta(state, ev.state_delta)
+        expected.append(ev)
+
+    events, final_state = generate_events(scene, EngineState.default(), sel, entries, TraceRNG(seed=11), 4)
+    assert events == expected
+    assert final_state == state
+
+
+def test_disabled_trace_keeps_draws():
+    entries = load_pack("data/core_complications.json")
+    scene = SceneContext(
+        scene_id="quiet",
+        scene_phase="engage",
+        environment=["dungeon"],
+        tone=["gritty"],
+        constraints=Constraints(confinement=0.8, connectivity=0.2, visibility=0.7),
+    )
+    sel = SelectionContext(
+        enabled_packs=["core_complications_v0_1"],
+        include_tags=["hazard","reinforcements","time_pressure","social_friction","visibility"],
+        exclude_tags=[],
+        factions_present=[],
+        rarity_mode="spiky",
+    )
+    traced, quiet = TraceRNG(seed=9), TraceRNG(seed=9, trace_enabled=False)
+    for _ in range(20):
+        a = generate_event(scene, EngineState.default(), sel, entries, traced)
+        b = generate_event(scene, EngineState.default(), sel, entries, quiet)
+        assert (a.event_id, a.severity, a.effect_vector) == (b.event_id, b.severity, b.effect_vector)
+        assert b.rng_trace == []
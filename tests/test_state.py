@@ -24,3 +24,10 @@ def test_apply_state_delta_clamps_clocks():
     d = StateDelta(clocks={"tension": 999}, recent_event_ids_add=[], tag_cooldowns_set={}, flags_set={})
     s2 = apply_state_delta(s, d, clock_min=0, clock_max=12)
     assert s2.clocks["tension"] == 12
+
+
+def test_apply_state_delta_dedupes_recent_ids_newest_first():
+    s = EngineState(clocks={}, recent_event_ids=["c", "a", "d", "c"], tag_cooldowns={}, flags={})
+    d = StateDelta(clocks={}, recent_event_ids_add=["a", "b", "a"], tag_cooldowns_set={}, flags_set={})
+    assert apply_state_delta(s, d).recent_event_ids == ["a", "b", "c", "d"]
+    assert apply_state_delta(s, d, recent_max_len=3).recent_event_ids == ["a", "b", "c"]